@@ -304,6 +304,9 @@ def create(
     preview: bool = typer.Option(
         False, "--preview", help="Preview files to be processed without actually processing them"
     ),
+    force: bool = typer.Option(
+        False, "--force", "-f", help="Regenerate outputs even if they are up to date, without reusing cached LLM responses"
+    ),
 ):
     """
     Generate content from text using local LLM inference.
@@ -414,7 +417,8 @@ def create(
                 verbose=verbose,
                 provider=provider,
                 chunk_size=chunk_size,
-                chunk_overlap=chunk_overlap
+                chunk_overlap=chunk_overlap,
+                force=force
             )
             
             # Return appropriate exit code
@@ -441,7 +445,8 @@ def create(
                     verbose,
                     provider=provider,
                     chunk_size=chunk_size,
-                    chunk_overlap=chunk_overlap
+                    chunk_overlap=chunk_overlap,
+                    force=force
                 )
             if output_path:
                 console.print(f"✅ Content saved to [bold]{output_path}[/bold]", style="green")
@@ -5,18 +5,73 @@
 # the root directory of this source tree.
 # Generate the content: CoT/QA/Summary Datasets
 import os
-import json
+import asyncio
+import functools
+import hashlib
+import io
+import orjson
 from pathlib import Path
-from typing import Optional, Dict, Any
+from tqdm import tqdm
+from typing import Optional, Dict, Any, AsyncIterator, Iterable, List, Tuple
 
 from synthetic_data_kit.models.llm_client import LLMClient
+from synthetic_data_kit.models.cached_llm_client import CachedLLMClient
 from synthetic_data_kit.generators.qa_generator import QAGenerator
 from synthetic_data_kit.generators.vqa_generator import VQAGenerator
 from synthetic_data_kit.generators.multimodal_qa_generator import MultimodalQAGenerator
+from synthetic_data_kit.generators.cot_generator import COTGenerator
 
-from synthetic_data_kit.utils.config import get_generation_config
+from synthetic_data_kit.utils.config import (
+    load_config,
+    get_generation_config,
+    get_llm_cache_config,
+    get_llm_provider,
+    get_openai_config,
+    get_vllm_config,
+)
+from synthetic_data_kit.utils.llm_processing import convert_to_conversation_format
+from synthetic_data_kit.utils.async_utils import run_sync
+
+from synthetic_data_kit.utils.lance_utils import iter_lance_rows
+
+# Output file suffix per content type, for the types whose output can be reused
+OUTPUT_SUFFIXES = {
+    "qa": "_qa_pairs.json",
+    "summary": "_summary.json",
+    "cot": "_cot_examples.json",
+    "cot-enhance": "_enhanced.json",
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _get_llm_client(
+    config_path: Optional[Path],
+    provider: Optional[str],
+    api_base: Optional[str],
+    model_name: Optional[str],
+    chunk_size: Optional[int],
+    chunk_overlap: Optional[int],
+) -> LLMClient:
+    """Build an LLM client, reusing it (and its connection pool) for repeated settings
+
+    The chunking overrides are part of the key because they are applied to the
+    client's config, which the generators read.
+    """
+    client = LLMClient(
+        config_path=config_path,
+        provider=provider,
+        api_base=api_base,
+        model_name=model_name
+    )
+
+    # Override chunking config if provided
+    if chunk_size is not None:
+        client.config.setdefault('generation', {})['chunk_size'] = chunk_size
+    if chunk_overlap is not None:
+        client.config.setdefault('generation', {})['overlap'] = chunk_overlap
+
+    return client
 
-from synthetic_data_kit.utils.lance_utils import load_lance_dataset
 
 def read_json(file_path):
     # Read the file
@@ -25,6 +80,486 @@ def read_json(file_path):
     return document_text
 
 
+def write_json(file_path: str, data: Any) -> None:
+    """Write `data` to `file_path` as JSON indented by two spaces"""
+    with open(file_path, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+
+async def write_qa_pairs_stream(
+    file_path: str,
+    summary: str,
+    qa_pairs: AsyncIterator[Dict[str, str]],
+) -> int:
+    """Write QA pairs to `file_path` as they are produced
+
+    The file has the same layout `write_json` produces for
+    {"summary": ..., "qa_pairs": [...]}, so curate and save-as read it unchanged.
+    Pairs go to `file_path + ".partial"`, which replaces `file_path` only once
+    the stream is exhausted; an interrupted run leaves the partial file behind.
+
+    Returns:
+        Number of QA pairs written
+    """
+    partial_path = file_path + ".partial"
+    count = 0
+    with open(partial_path, 'wb') as f:
+        f.write(b'{\n  "summary": ' + orjson.dumps(summary) + b',\n  "qa_pairs": [')
+        async for pair in qa_pairs:
+            f.write(b',\n    ' if count else b'\n    ')
+            # Re-indent the pair to sit two levels deep in the document
+            f.write(orjson.dumps(pair, option=orjson.OPT_INDENT_2).replace(b'\n', b'\n    '))
+            count += 1
+        f.write(b'\n  ]\n}' if count else b']\n}')
+    os.replace(partial_path, file_path)
+    return count
+
+
+def join_document_text(documents, max_chars: Optional[int] = None) -> str:
+    """Join document texts with spaces, stopping once at least `max_chars` characters are collected
+
+    Documents are consumed one at a time, so a streamed .lance dataset is never
+    held in memory as a list of texts alongside the joined string.
+    """
+    buffer = io.StringIO()
+    for i, doc in enumerate(documents):
+        if i:
+            buffer.write(" ")
+        buffer.write(doc["text"])
+        if max_chars is not None and buffer.tell() >= max_chars:
+            break
+    return buffer.getvalue()
+
+
+def compute_fingerprint(file_path: str, settings: Dict[str, Any]) -> str:
+    """Hash the input file (or every file of a .lance directory) and the settings
+
+    Uses BLAKE2b, which is fast on large inputs and part of the standard library.
+    """
+    hasher = hashlib.blake2b(digest_size=32)
+    if os.path.isdir(file_path):
+        paths = sorted(
+            os.path.join(root, name)
+            for root, _, names in os.walk(file_path)
+            for name in names
+        )
+    else:
+        paths = [file_path]
+
+    for path in paths:
+        hasher.update(os.path.relpath(path, file_path).encode("utf-8"))
+        with open(path, 'rb') as f:
+            while chunk := f.read(1 << 20):
+                hasher.update(chunk)
+
+    hasher.update(orjson.dumps(settings, option=orjson.OPT_SORT_KEYS, default=str))
+    return hasher.hexdigest()
+
+
+def _generation_settings(
+    config_path: Optional[Path],
+    provider: Optional[str],
+    api_base: Optional[str],
+    model_name: Optional[str],
+    chunk_size: Optional[int],
+    chunk_overlap: Optional[int],
+) -> Dict[str, Any]:
+    """Resolve the settings `_get_llm_client` would use, without building (or probing) a client"""
+    config = load_config(config_path)
+    if chunk_size is not None:
+        config.setdefault('generation', {})['chunk_size'] = chunk_size
+    if chunk_overlap is not None:
+        config.setdefault('generation', {})['overlap'] = chunk_overlap
+
+    provider = provider or get_llm_provider(config)
+    provider_config = get_openai_config(config) if provider == 'api-endpoint' else get_vllm_config(config)
+    return {
+        "provider": provider,
+        "api_base": api_base or provider_config.get('api_base'),
+        "model": model_name or provider_config.get('model'),
+        "config": config,
+    }
+
+
+def is_up_to_date(output_path: str, fingerprint: str) -> bool:
+    """Check whether `output_path` was generated from inputs with this fingerprint"""
+    meta_path = output_path + ".meta"
+    if not (os.path.exists(output_path) and os.path.exists(meta_path)):
+        return False
+    with open(meta_path, 'r', encoding='utf-8') as f:
+        return f.read().strip() == fingerprint
+
+
+def write_fingerprint(output_path: str, fingerprint: str) -> None:
+    """Record the fingerprint of the inputs `output_path` was generated from"""
+    with open(output_path + ".meta", 'w', encoding='utf-8') as f:
+        f.write(fingerprint)
+
+
+def discard_fingerprint(output_path: str) -> None:
+    """Remove the fingerprint of `output_path`, so it is regenerated on the next run"""
+    try:
+        os.remove(output_path + ".meta")
+    except FileNotFoundError:
+        pass
+
+
+def _handle_qa(
+    client: LLMClient,
+    documents: Iterable[Dict[str, Any]],
+    file_path: str,
+    output_dir: str,
+    base_name: str,
+    config_path: Optional[Path],
+    num_pairs: Optional[int],
+    verbose: bool,
+    rolling_summary: Optional[bool],
+) -> Tuple[str, bool]:
+    """Generate QA pairs, streaming each pair to the output file as it arrives"""
+    generator = QAGenerator(client, config_path)
+
+    # Get num_pairs from args or config
+    if num_pairs is None:
+        config = client.config
+        generation_config = get_generation_config(config)
+        num_pairs = generation_config.get("num_pairs", 25)
+    
+    output_path = os.path.join(output_dir, f"{base_name}_qa_pairs.json")
+    print(f"Saving result to {output_path}")
+
+    # Generate with concurrent LLM requests and write each pair as it arrives
+    # (the loop lives for this file only, so its connections are closed at the end)
+    async def generate_and_save() -> int:
+        try:
+            summary, qa_pairs = await generator.aprocess_documents_stream(
+                documents,
+                num_pairs=num_pairs,
+                verbose=verbose,
+                rolling_summary=rolling_summary
+            )
+            return await write_qa_pairs_stream(output_path, summary, qa_pairs)
+        finally:
+            await client.aclose()
+
+    num_written = run_sync(generate_and_save())
+    print(f"Successfully wrote {num_written} QA pairs to {output_path}")
+    if generator.failed_requests:
+        print(f"Warning: {generator.failed_requests} request(s) failed; {output_path} is incomplete")
+    
+    return output_path, generator.failed_requests == 0
+
+
+def _handle_multimodal_qa(
+    client: LLMClient,
+    documents: Iterable[Dict[str, Any]],
+    file_path: str,
+    output_dir: str,
+    base_name: str,
+    config_path: Optional[Path],
+    num_pairs: Optional[int],
+    verbose: bool,
+    rolling_summary: Optional[bool],
+) -> Tuple[str, bool]:
+    """Generate text QA pairs from text and image context"""
+    generator = MultimodalQAGenerator(client, config_path)
+    output_path = generator.process_dataset(
+        documents=documents,
+        output_dir=output_dir,
+        num_examples=num_pairs,
+        verbose=verbose,
+        base_name=base_name,
+    )
+    return output_path, True
+
+
+def _handle_vqa(
+    client: LLMClient,
+    documents: Iterable[Dict[str, Any]],
+    file_path: str,
+    output_dir: str,
+    base_name: str,
+    config_path: Optional[Path],
+    num_pairs: Optional[int],
+    verbose: bool,
+    rolling_summary: Optional[bool],
+) -> Tuple[str, bool]:
+    """Add reasoning to visual question answering data"""
+    generator = VQAGenerator(client, config_path)
+    output_path = generator.process_dataset(
+        documents=documents,
+        output_dir=output_dir,
+        num_examples=num_pairs,
+        verbose=verbose
+    )
+    return output_path, True
+
+
+def _handle_summary(
+    client: LLMClient,
+    documents: Iterable[Dict[str, Any]],
+    file_path: str,
+    output_dir: str,
+    base_name: str,
+    config_path: Optional[Path],
+    num_pairs: Optional[int],
+    verbose: bool,
+    rolling_summary: Optional[bool],
+) -> Tuple[str, bool]:
+    """Generate a summary of the documents"""
+    generator = QAGenerator(client, config_path)
+
+    # Generate just the summary
+    if rolling_summary:
+        # Rolling summaries cover the whole document chunk by chunk
+        full_text = join_document_text(documents)
+        summary = generator.generate_summary(full_text, rolling_summary=True)
+    else:
+        # A single-pass summary only sees the first max_context_length characters
+        max_context_length = generator.generation_config.get("max_context_length", 8000)
+        summary = generator.generate_summary(
+            join_document_text(documents, max_chars=max_context_length)
+        )
+    
+    # Save output
+    output_path = os.path.join(output_dir, f"{base_name}_summary.json")
+    write_json(output_path, {"summary": summary})
+    
+    return output_path, True
+
+
+# So there are two separate categories of CoT
+# Simply CoT maps to "Hey I want CoT being generated"
+# CoT-enhance maps to "Please enhance my dataset with CoT"
+
+def _handle_cot(
+    client: LLMClient,
+    documents: Iterable[Dict[str, Any]],
+    file_path: str,
+    output_dir: str,
+    base_name: str,
+    config_path: Optional[Path],
+    num_pairs: Optional[int],
+    verbose: bool,
+    rolling_summary: Optional[bool],
+) -> Tuple[str, bool]:
+    """Generate chain-of-thought examples from the documents"""
+    # Initialize the CoT generator
+    generator = COTGenerator(client, config_path)
+
+    full_text = join_document_text(documents)
+    
+    # Get num_examples from args or config
+    if num_pairs is None:
+        config = client.config
+        generation_config = get_generation_config(config)
+        num_pairs = generation_config.get("num_cot_examples", 5)
+    
+    # Process document to generate CoT examples
+    result = generator.process_document(
+        full_text,
+        num_examples=num_pairs,
+        include_simple_steps=verbose  # More detailed if verbose is enabled
+    )
+    
+    # Save output
+    output_path = os.path.join(output_dir, f"{base_name}_cot_examples.json")
+    write_json(output_path, result)
+    
+    if verbose:
+        # Print some example content
+        if result.get("cot_examples") and len(result.get("cot_examples", [])) > 0:
+            first_example = result["cot_examples"][0]
+            print("\nFirst CoT Example:")
+            print(f"Question: {first_example.get('question', '')}")
+            print(f"Reasoning (first 100 chars): {first_example.get('reasoning', '')[:100]}...")
+            print(f"Answer: {first_example.get('answer', '')}")
+    
+    # Failed chunk requests are skipped by the generator, so an empty result means none succeeded
+    return output_path, bool(result.get("cot_examples"))
+
+
+def _classify_cot_input(data: Any) -> str:
+    """Classify a cot-enhance input by its top-level type and first item
+    
+    Conversation files are homogeneous, so only the first item of a list is inspected.
+    """
+    if isinstance(data, dict):
+        if "qa_pairs" in data:
+            # QA pairs format from "create qa" command (the most common input format)
+            return "qa_pairs"
+        if "conversations" in data:
+            # Single conversation with a conversations array
+            return "single_wrapped"
+    elif isinstance(data, list):
+        if not data or not isinstance(data[0], dict) or "conversations" in data[0]:
+            # Array of conversation objects, each with a conversations array
+            return "wrapped_list"
+        if "from" in data[0]:
+            # Direct list of messages for a single conversation
+            return "msg_list"
+    return "unknown"
+
+
+def _qa_pairs_to_conversations(data: Dict[str, Any]) -> Tuple[List[Any], bool]:
+    conv_list = convert_to_conversation_format(data.get("qa_pairs", []))
+    # Wrap each conversation in the expected format
+    return [{"conversations": conv} for conv in conv_list], False
+
+
+def _single_wrapped_to_conversations(data: Dict[str, Any]) -> Tuple[List[Any], bool]:
+    return [data], True
+
+
+def _wrapped_list_to_conversations(data: List[Any]) -> Tuple[List[Any], bool]:
+    return data, False
+
+
+def _msg_list_to_conversations(data: List[Any]) -> Tuple[List[Any], bool]:
+    return [{"conversations": data}], True
+
+
+# cot-enhance input format -> (conversations, is_single_conversation) converter;
+# unknown inputs are treated as a generic list of conversations
+COT_INPUT_FORMATS = {
+    "qa_pairs": _qa_pairs_to_conversations,
+    "single_wrapped": _single_wrapped_to_conversations,
+    "wrapped_list": _wrapped_list_to_conversations,
+    "msg_list": _msg_list_to_conversations,
+    "unknown": _wrapped_list_to_conversations,
+}
+
+
+def _handle_cot_enhance(
+    client: LLMClient,
+    documents: Iterable[Dict[str, Any]],
+    file_path: str,
+    output_dir: str,
+    base_name: str,
+    config_path: Optional[Path],
+    num_pairs: Optional[int],
+    verbose: bool,
+    rolling_summary: Optional[bool],
+) -> Tuple[str, bool]:
+    """Enhance existing conversations or QA pairs with chain-of-thought reasoning"""
+    # Initialize the CoT generator
+    generator = COTGenerator(client, config_path)
+    
+    # Get max_examples from args or config
+    max_examples = None
+    if num_pairs is not None:
+        max_examples = num_pairs  # If user specified a number, use it
+    else:
+        config = client.config
+        generation_config = get_generation_config(config)
+        # Get the config value (will be None by default, meaning enhance all)
+        max_examples = generation_config.get("num_cot_enhance_examples")
+    
+    # Instead of parsing as text, load the file as JSON with conversations
+    try:
+        with open(file_path, 'rb') as f:
+            data = orjson.loads(f.read())
+        
+        # Handle different dataset formats
+        input_format = _classify_cot_input(data)
+        if verbose and input_format == "qa_pairs":
+            print(f"Converting {len(data.get('qa_pairs', []))} QA pairs to conversation format")
+        conversations, is_single_conversation = COT_INPUT_FORMATS[input_format](data)
+        
+        # Limit the number of conversations if needed
+        if max_examples is not None and len(conversations) > max_examples:
+            if verbose:
+                print(f"Limiting to {max_examples} conversations (from {len(conversations)} total)")
+            conversations = conversations[:max_examples]
+        
+        if verbose:
+            print(f"Found {len(conversations)} conversation(s) to enhance")
+        
+        # Select the conversations to enhance; anything else is kept as-is
+        to_enhance = []
+        for i, conversation in enumerate(conversations):
+            # Check if this item has a conversations field
+            if isinstance(conversation, dict) and "conversations" in conversation:
+                conv_messages = conversation["conversations"]
+                
+                # Validate messages format
+                if not isinstance(conv_messages, list):
+                    print(f"Warning: conversations field is not a list in item {i}, skipping")
+                    continue
+                
+                if verbose:
+                    print(f"Debug - Conv_messages type: {type(conv_messages)}")
+                    print(f"Debug - Conv_messages structure: {conv_messages[:1]}")
+                to_enhance.append(i)
+        
+        # Enhance conversations concurrently, bounded by llm_concurrency
+        concurrency = generator.generation_config.get("llm_concurrency", 16)
+        
+        async def enhance_all() -> list:
+            semaphore = asyncio.Semaphore(concurrency)
+            progress = tqdm(total=len(to_enhance), desc="Enhancing conversations")
+            
+            async def enhance_one(conv_messages):
+                async with semaphore:
+                    # Always include simple steps when enhancing QA pairs
+                    enhanced = await generator.aenhance_with_cot(conv_messages, include_simple_steps=True)
+                progress.update(1)
+                return enhanced
+            
+            try:
+                return await asyncio.gather(
+                    *(enhance_one(conversations[i]["conversations"]) for i in to_enhance)
+                )
+            finally:
+                progress.close()
+                await client.aclose()
+        
+        enhanced_conversations = list(conversations)
+        for i, enhanced_messages in zip(to_enhance, run_sync(enhance_all())):
+            # Handle nested bug
+            if enhanced_messages and isinstance(enhanced_messages, list):
+                # Nested bug
+                if enhanced_messages and isinstance(enhanced_messages[0], list):
+                    if verbose:
+                        print(f"Debug - Flattening nested array response")
+                    enhanced_messages = enhanced_messages[0]
+            
+            # Create enhanced conversation with same structure
+            enhanced_conv = conversations[i].copy()
+            enhanced_conv["conversations"] = enhanced_messages
+            enhanced_conversations[i] = enhanced_conv
+        
+        # Save enhanced conversations
+        output_path = os.path.join(output_dir, f"{base_name}_enhanced.json")
+        
+        if is_single_conversation and len(enhanced_conversations) == 1:
+            # Save the single conversation
+            write_json(output_path, enhanced_conversations[0])
+        else:
+            # Save the array of conversations
+            write_json(output_path, enhanced_conversations)
+        
+        if verbose:
+            print(f"Enhanced {len(enhanced_conversations)} conversation(s)")
+        
+        return output_path, True
+        
+    except orjson.JSONDecodeError:
+        raise ValueError(f"Failed to parse {file_path} as JSON. For cot-enhance, input must be a valid JSON file.")
+
+
+
+# Content type -> handler producing the output file and returning its path and
+# whether it is complete (no LLM request failed), i.e. safe to reuse on later runs
+CONTENT_HANDLERS = {
+    "qa": _handle_qa,
+    "multimodal-qa": _handle_multimodal_qa,
+    "vqa": _handle_vqa,
+    "summary": _handle_summary,
+    "cot": _handle_cot,
+    "cot-enhance": _handle_cot_enhance,
+}
+
+
 def process_file(
     file_path: str,
     output_dir: str,
@@ -38,6 +573,7 @@ def process_file(
     chunk_size: Optional[int] = None,
     chunk_overlap: Optional[int] = None,
     rolling_summary: Optional[bool] = False,
+    force: bool = False,
 ) -> str:
     """Process a file to generate content
     
@@ -47,274 +583,92 @@ def process_file(
         config_path: Path to configuration file
         api_base: VLLM API base URL
         model: Model to use
-        content_type: Type of content to generate (qa, summary, cot)
+        content_type: Type of content to generate (a key of CONTENT_HANDLERS)
         num_pairs: Target number of QA pairs to generate
         threshold: Quality threshold for filtering (1-10)
+        force: Regenerate the output even if it is up to date with the inputs,
+            bypassing cached LLM responses
     
     Returns:
         Path to the output file
     """
+    try:
+        handler = CONTENT_HANDLERS[content_type]
+    except KeyError:
+        raise ValueError(f"Unknown content type: {content_type}") from None
+
     # Create output directory if it doesn't exist
     # The reason for having this directory logic for now is explained in context.py
     os.makedirs(output_dir, exist_ok=True)
     
-    # Initialize LLM client
-    client = LLMClient(
-        config_path=config_path,
-        provider=provider,
-        api_base=api_base,
-        model_name=model
-    )
-    
-    # Override chunking config if provided
-    if chunk_size is not None:
-        client.config.setdefault('generation', {})['chunk_size'] = chunk_size
-    if chunk_overlap is not None:
-        client.config.setdefault('generation', {})['overlap'] = chunk_overlap
-    
-    # Debug: Print which provider is being used
-    print(f"L Using {client.provider} provider")
-    
     # Generate base filename for output
     base_name = os.path.splitext(os.path.basename(file_path))[0]
     
-    # Generate content based on type
-    if file_path.endswith(".lance"):
-        dataset = load_lance_dataset(file_path)
-        documents = dataset.to_table().to_pylist()
-    else:
-        documents = [{"text": read_json(file_path), "image": None}]
-
-    if content_type == "qa":
-        generator = QAGenerator(client, config_path)
-
-        # Get num_pairs from args or config
-        if num_pairs is None:
-            config = client.config
-            generation_config = get_generation_config(config)
-            num_pairs = generation_config.get("num_pairs", 25)
-        
-        # Process document
-        result = generator.process_documents(
-            documents,
-            num_pairs=num_pairs,
-            verbose=verbose,
-            rolling_summary=rolling_summary
-        )
-        
-        # Save output
-        output_path = os.path.join(output_dir, f"{base_name}_qa_pairs.json")
-        print(f"Saving result to {output_path}")
-            
-        # Now save the actual result
-        try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2)
-            print(f"Successfully wrote result to {output_path}")
-        except Exception as e:
-            print(f"Error writing result file: {e}")
-        
-        return output_path
+    # Return the existing output if it was generated from identical inputs and settings.
+    # Checked before building the client, which for vLLM probes the server.
+    fingerprint = None
+    if content_type in OUTPUT_SUFFIXES:
+        output_path = os.path.join(output_dir, f"{base_name}{OUTPUT_SUFFIXES[content_type]}")
+        settings = {
+            "content_type": content_type,
+            "num_pairs": num_pairs,
+            "rolling_summary": rolling_summary,
+            **_generation_settings(config_path, provider, api_base, model, chunk_size, chunk_overlap),
+        }
+        if content_type == "cot":
+            # cot asks for simple reasoning steps in verbose mode, which changes the prompt
+            settings["verbose"] = verbose
+        fingerprint = compute_fingerprint(file_path, settings)
+        if not force and is_up_to_date(output_path, fingerprint):
+            print(f"Skipping generation, {output_path} is up to date")
+            return output_path
+        # The output is about to be replaced; don't let an interrupted or failed run look up to date
+        discard_fingerprint(output_path)
     
-    elif content_type == "multimodal-qa":
-        generator = MultimodalQAGenerator(client, config_path)
-        output_path = generator.process_dataset(
-            documents=documents,
-            output_dir=output_dir,
-            num_examples=num_pairs,
-            verbose=verbose,
-            base_name=base_name,
-        )
-        return output_path
-
-    elif content_type == "vqa":
-        generator = VQAGenerator(client, config_path)
-        output_path = generator.process_dataset(
-            documents=documents,
-            output_dir=output_dir,
-            num_examples=num_pairs,
-            verbose=verbose
-        )
-        return output_path
+    # Initialize LLM client, or reuse the one built for the same settings
+    client = _get_llm_client(config_path, provider, api_base, model, chunk_size, chunk_overlap)
 
-    elif content_type == "summary":
-        generator = QAGenerator(client, config_path)
-
-        full_text = " ".join([doc["text"] for doc in documents])
-        
-        # Generate just the summary
-        summary = generator.generate_summary(full_text)
-        
-        # Save output
-        output_path = os.path.join(output_dir, f"{base_name}_summary.json")
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump({"summary": summary}, f, indent=2)
-        
-        return output_path
+    # Reuse stored responses for requests already answered in a previous run;
+    # a forced run asks the model again and refreshes the stored responses
+    cache_config = get_llm_cache_config(client.config)
+    if cache_config.get("enabled", True):
+        client = CachedLLMClient(
+            client,
+            cache_dir=os.path.join(output_dir, ".llm_cache"),
+            semantic=cache_config.get("semantic", False),
+            similarity_threshold=cache_config.get("similarity_threshold", 0.95),
+            embedding_model=cache_config.get("embedding_model", "all-MiniLM-L6-v2"),
+            refresh=force,
+        )
     
-    # So there are two separate categories of CoT
-    # Simply CoT maps to "Hey I want CoT being generated"
-    # CoT-enhance maps to "Please enhance my dataset with CoT"
+    # Debug: Print which provider is being used
+    print(f"L Using {client.provider} provider")
     
-    elif content_type == "cot":
-        from synthetic_data_kit.generators.cot_generator import COTGenerator
-        
-        # Initialize the CoT generator
-        generator = COTGenerator(client, config_path)
-
-        full_text = " ".join([doc["text"] for doc in documents])
-        
-        # Get num_examples from args or config
-        if num_pairs is None:
-            config = client.config
-            generation_config = get_generation_config(config)
-            num_pairs = generation_config.get("num_cot_examples", 5)
-        
-        # Process document to generate CoT examples
-        result = generator.process_document(
-            full_text,
-            num_examples=num_pairs,
-            include_simple_steps=verbose  # More detailed if verbose is enabled
-        )
-        
-        # Save output
-        output_path = os.path.join(output_dir, f"{base_name}_cot_examples.json")
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2)
-        
-        if verbose:
-            # Print some example content
-            if result.get("cot_examples") and len(result.get("cot_examples", [])) > 0:
-                first_example = result["cot_examples"][0]
-                print("\nFirst CoT Example:")
-                print(f"Question: {first_example.get('question', '')}")
-                print(f"Reasoning (first 100 chars): {first_example.get('reasoning', '')[:100]}...")
-                print(f"Answer: {first_example.get('answer', '')}")
-        
-        return output_path
-        
+    # Load the input documents
+    if file_path.endswith(".lance"):
+        # Stream rows batch by batch instead of materializing the whole table,
+        # reading the image column only for the types that use it
+        columns = ["text", "image"] if content_type in ("multimodal-qa", "vqa") else ["text"]
+        documents = iter_lance_rows(file_path, columns=columns)
     elif content_type == "cot-enhance":
-        from synthetic_data_kit.generators.cot_generator import COTGenerator
-        from tqdm import tqdm
-        
-        # Initialize the CoT generator
-        generator = COTGenerator(client, config_path)
-
-        document_text = read_json(file_path)
-        
-        # Get max_examples from args or config
-        max_examples = None
-        if num_pairs is not None:
-            max_examples = num_pairs  # If user specified a number, use it
-        else:
-            config = client.config
-            generation_config = get_generation_config(config)
-            # Get the config value (will be None by default, meaning enhance all)
-            max_examples = generation_config.get("num_cot_enhance_examples")
-        
-        # Instead of parsing as text, load the file as JSON with conversations
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Handle different dataset formats
-            # First, check for QA pairs format (the most common input format)
-            if isinstance(data, dict) and "qa_pairs" in data:
-                # QA pairs format from "create qa" command (make this the primary format)
-                from synthetic_data_kit.utils.llm_processing import convert_to_conversation_format
-                
-                qa_pairs = data.get("qa_pairs", [])
-                if verbose:
-                    print(f"Converting {len(qa_pairs)} QA pairs to conversation format")
-                
-                conv_list = convert_to_conversation_format(qa_pairs)
-                # Wrap each conversation in the expected format
-                conversations = [{"conversations": conv} for conv in conv_list]
-                is_single_conversation = False
-            # Then handle other conversation formats for backward compatibility
-            elif isinstance(data, dict) and "conversations" in data:
-                # Single conversation with a conversations array
-                conversations = [data]
-                is_single_conversation = True
-            elif isinstance(data, list) and all("conversations" in item for item in data if isinstance(item, dict)):
-                # Array of conversation objects, each with a conversations array
-                conversations = data
-                is_single_conversation = False
-            elif isinstance(data, list) and all(isinstance(msg, dict) and "from" in msg for msg in data):
-                # Direct list of messages for a single conversation
-                conversations = [{"conversations": data}]
-                is_single_conversation = True
-            else:
-                # Try to handle as a generic list of conversations
-                conversations = data
-                is_single_conversation = False
-            
-            # Limit the number of conversations if needed
-            if max_examples is not None and len(conversations) > max_examples:
-                if verbose:
-                    print(f"Limiting to {max_examples} conversations (from {len(conversations)} total)")
-                conversations = conversations[:max_examples]
-            
-            if verbose:
-                print(f"Found {len(conversations)} conversation(s) to enhance")
-            
-            # Process each conversation
-            enhanced_conversations = []
-            
-            for i, conversation in enumerate(tqdm(conversations, desc="Enhancing conversations")):
-                # Check if this item has a conversations field
-                if isinstance(conversation, dict) and "conversations" in conversation:
-                    conv_messages = conversation["conversations"]
-                    
-                    # Validate messages format
-                    if not isinstance(conv_messages, list):
-                        print(f"Warning: conversations field is not a list in item {i}, skipping")
-                        enhanced_conversations.append(conversation)  # Keep original
-                        continue
-                    
-                    # Enhance this conversation's messages
-                    if verbose:
-                        print(f"Debug - Conv_messages type: {type(conv_messages)}")
-                        print(f"Debug - Conv_messages structure: {conv_messages[:1] if isinstance(conv_messages, list) else 'Not a list'}")
-                    
-                    # Always include simple steps when enhancing QA pairs
-                    enhanced_messages = generator.enhance_with_cot(conv_messages, include_simple_steps=True)
-                    
-                    # Handle nested bug
-                    if enhanced_messages and isinstance(enhanced_messages, list):
-                        # Nested bug
-                        if enhanced_messages and isinstance(enhanced_messages[0], list):
-                            if verbose:
-                                print(f"Debug - Flattening nested array response")
-                            enhanced_messages = enhanced_messages[0]
-                    
-                    # Create enhanced conversation with same structure
-                    enhanced_conv = conversation.copy()
-                    enhanced_conv["conversations"] = enhanced_messages
-                    enhanced_conversations.append(enhanced_conv)
-                else:
-                    # Not the expected format, just keep original
-                    enhanced_conversations.append(conversation)
-            
-            # Save enhanced conversations
-            output_path = os.path.join(output_dir, f"{base_name}_enhanced.json")
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                if is_single_conversation and len(enhanced_conversations) == 1:
-                    # Save the single conversation
-                    json.dump(enhanced_conversations[0], f, indent=2)
-                else:
-                    # Save the array of conversations
-                    json.dump(enhanced_conversations, f, indent=2)
-            
-            if verbose:
-                print(f"Enhanced {len(enhanced_conversations)} conversation(s)")
-                
-            return output_path
-            
-        except json.JSONDecodeError:
-            raise ValueError(f"Failed to parse {file_path} as JSON. For cot-enhance, input must be a valid JSON file.")
+        # cot-enhance parses its JSON input itself
+        documents = []
+    else:
+        documents = [{"text": read_json(file_path), "image": None}]
 
+    output_path, complete = handler(
+        client,
+        documents,
+        file_path,
+        output_dir,
+        base_name,
+        config_path,
+        num_pairs,
+        verbose,
+        rolling_summary,
+    )
 
-    else:
-        raise ValueError(f"Unknown content type: {content_type}")
\ No newline at end of file
+    # Only complete outputs are reused; one with failed requests is regenerated next run
+    if fingerprint is not None and complete:
+        write_fingerprint(output_path, fingerprint)
+    return output_path
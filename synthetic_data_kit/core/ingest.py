@@ -5,19 +5,56 @@
 # the root directory of this source tree.
 # Ingest different file formats
 
+import asyncio
+import collections
+import functools
+import multiprocessing
 import os
+import re
 import sys
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Union, Callable
+from urllib.parse import urlparse
 import importlib
 
 from synthetic_data_kit.utils.config import get_path_config
+from synthetic_data_kit.utils.async_utils import run_sync
+
+# Shared session so repeated requests reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Local file types whose parsers are CPU-bound Python code
+CPU_BOUND_EXTENSIONS = (".pdf", ".docx", ".pptx")
+
+# Video ID in youtube.com/watch?v=<id> and youtu.be/<id> URLs
+_YT_ID_RE = re.compile(r"(?:v=|\.be/)([^&]+)")
+_YT_HOSTS = ("youtube.com", "youtu.be")
+# Maps "." to "_" when turning a URL domain into an output name
+_DOMAIN_NAME_TABLE = str.maketrans(".", "_")
+
+
+@functools.lru_cache(maxsize=1024)
+def _fetch_is_pdf(url: str) -> bool:
+    """HEAD `url` and report whether it serves PDF content
+
+    Raises requests.RequestException on network errors, which lru_cache does
+    not memoize, so a transient failure is retried on the next check.
+    """
+    response = _SESSION.head(url, allow_redirects=True, timeout=5)
+    content_type = response.headers.get("Content-Type", "")
+    return "application/pdf" in content_type
 
 
 def _check_pdf_url(url: str) -> bool:
     """Check if `url` points to PDF content
 
+    Successful checks are memoized, so each URL is only fetched once per process.
+
     Args:
         url: URL to check
 
@@ -26,9 +63,7 @@ def _check_pdf_url(url: str) -> bool:
         bool: True if the URL points to PDF content, False otherwise
     """
     try:
-        response = requests.head(url, allow_redirects=True)
-        content_type = response.headers.get("Content-Type", "")
-        return "application/pdf" in content_type
+        return _fetch_is_pdf(url)
     except requests.RequestException:
         return False
 
@@ -56,7 +91,7 @@ def determine_parser(file_path: str, config: Dict[str, Any], multimodal: bool =
     # Check if it's a URL
     if file_path.startswith(("http://", "https://")):
         # YouTube URL
-        if "youtube.com" in file_path or "youtu.be" in file_path:
+        if any(host in file_path for host in _YT_HOSTS):
             return YouTubeParser()
         # PDF URL
         elif _check_pdf_url(file_path):
@@ -83,6 +118,26 @@ def determine_parser(file_path: str, config: Dict[str, Any], multimodal: bool =
     raise FileNotFoundError(f"File not found: {file_path}")
 
 
+def _is_cpu_bound_file(file_path: str) -> bool:
+    """Whether `file_path` is a local file whose parser is CPU-bound"""
+    return (not file_path.startswith(("http://", "https://"))
+            and os.path.splitext(file_path)[1].lower() in CPU_BOUND_EXTENSIONS)
+
+
+def _default_output_name(file_path: str) -> str:
+    """Output name (without extension) `process_file` uses when none is given"""
+    if file_path.startswith(("http://", "https://")):
+        # Extract filename from URL
+        if any(host in file_path for host in _YT_HOSTS):
+            # Use video ID for YouTube URLs
+            video_id = _YT_ID_RE.search(file_path).group(1)
+            return f"youtube_{video_id}"
+        # Use domain for other URLs
+        return urlparse(file_path).netloc.translate(_DOMAIN_NAME_TABLE)
+    # Use original filename
+    return os.path.splitext(os.path.basename(file_path))[0]
+
+
 def process_file(
     file_path: str,
     output_dir: Optional[str] = None,
@@ -105,35 +160,20 @@ def process_file(
     from synthetic_data_kit.utils.lance_utils import create_lance_dataset
     import pyarrow as pa
     # Create output directory if it doesn't exist
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir, exist_ok=True)
+    os.makedirs(output_dir, exist_ok=True)
 
     # Determine parser based on file type
     parser = determine_parser(file_path, config, multimodal)
 
-    # Parse the file
-    content = parser.parse(file_path)
+    # Parse the file; multimodal page extraction fans out across workers
+    if multimodal:
+        content = run_sync(parser.aparse(file_path))
+    else:
+        content = parser.parse(file_path)
 
     # Generate output filename if not provided
     if not output_name:
-        if file_path.startswith(("http://", "https://")):
-            # Extract filename from URL
-            if "youtube.com" in file_path or "youtu.be" in file_path:
-                # Use video ID for YouTube URLs
-                import re
-
-                video_id = re.search(r"(?:v=|\.be/)([^&]+)", file_path).group(1)
-                output_name = f"youtube_{video_id}"
-            else:
-                # Use domain for other URLs
-                from urllib.parse import urlparse
-
-                domain = urlparse(file_path).netloc.replace(".", "_")
-                output_name = f"{domain}"
-        else:
-            # Use original filename
-            base_name = os.path.basename(file_path)
-            output_name = os.path.splitext(base_name)[0]
+        output_name = _default_output_name(file_path)
 
     output_name += ".lance"
     output_path = os.path.join(output_dir, output_name)
@@ -149,3 +189,79 @@ def process_file(
 
 
     return output_path
+
+
+async def aprocess_files(
+    file_paths: List[str],
+    output_dir: Optional[str] = None,
+    config: Optional[Dict[str, Any]] = None,
+    multimodal: bool = False,
+    max_concurrency: int = 8,
+    max_workers: Optional[int] = None,
+    on_complete: Optional[Callable[[str], None]] = None,
+) -> List[Union[str, Exception]]:
+    """Process several files concurrently
+
+    Local PDF, DOCX and PPTX files are parsed in a process pool, since their
+    parsers spend most of their time in Python code that holds the GIL. URLs
+    and other files are I/O-bound and run in the default thread pool. In
+    multimodal mode every file uses threads, as the multimodal parser already
+    spreads large PDFs across processes.
+
+    Inputs that map to the same output (e.g. report.pdf and report.docx) are
+    processed one after another, in input order, so they never write the same
+    dataset at once; as when processed sequentially, the last one wins.
+
+    Args:
+        file_paths: Paths or URLs to parse
+        output_dir: Directory to save parsed files
+        config: Configuration dictionary (if None, uses default)
+        multimodal: Whether to use the multimodal parser
+        max_concurrency: Maximum number of files processed at once in threads
+        max_workers: Processes for CPU-bound files (if None, uses the CPU count;
+            0 parses them in threads too)
+        on_complete: Called with each file path as soon as that file finishes,
+            successfully or not
+
+    Returns:
+        One entry per input, in input order: the output path, or the exception
+        raised while processing that file
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    use_processes = not multimodal and max_workers != 0
+    cpu_bound = {
+        file_path for file_path in file_paths
+        if use_processes and _is_cpu_bound_file(file_path)
+    }
+    # Spawn rather than fork: the parent may have Lance writer threads running
+    pool = ProcessPoolExecutor(
+        max_workers=min(max_workers or os.cpu_count() or 1, len(cpu_bound)),
+        mp_context=multiprocessing.get_context("spawn")
+    ) if cpu_bound else None
+
+    # One lock per output name; asyncio.Lock grants waiters in FIFO order
+    output_locks = collections.defaultdict(asyncio.Lock)
+
+    async def process_one(file_path: str) -> str:
+        # Only the file path and settings cross the process boundary
+        call = functools.partial(process_file, file_path, output_dir, None, config, multimodal)
+        try:
+            async with output_locks[_default_output_name(file_path)]:
+                if file_path in cpu_bound:
+                    return await loop.run_in_executor(pool, call)
+                async with semaphore:
+                    return await loop.run_in_executor(None, call)
+        finally:
+            if on_complete is not None:
+                on_complete(file_path)
+
+    try:
+        return await asyncio.gather(
+            *(process_one(file_path) for file_path in file_paths),
+            return_exceptions=True
+        )
+    finally:
+        if pool is not None:
+            pool.shutdown()
@@ -225,8 +225,8 @@ class COTGenerator:
         print(f"Generated {len(all_examples)} CoT examples total (requested: {num_examples})")
         return all_examples
     
-    def enhance_with_cot(self, conversations: List[Dict], include_simple_steps: bool = False) -> List[Dict]:
-        """Enhance existing conversations with CoT reasoning"""
+    def _build_enhancement_messages(self, conversations: List[Dict], include_simple_steps: bool) -> List[Dict[str, str]]:
+        """Build the CoT enhancement request for a list of conversations"""
         verbose = os.environ.get('SDK_VERBOSE', 'false').lower() == 'true'
         
         # Get the prompt template
@@ -243,19 +243,14 @@ class COTGenerator:
             include_simple_steps=str(include_simple_steps).lower()
         )
         
-        # Generate enhanced conversations
-        temperature = self.generation_config.get("temperature", 0.2)
-        max_tokens = self.generation_config.get("max_tokens", 4096)
-        
         if verbose:
             print(f"Enhancing {len(conversations)} conversations with CoT...")
         
-        messages = [{"role": "system", "content": prompt}]
-        response = self.client.chat_completion(
-            messages, 
-            temperature=temperature,
-            max_tokens=max_tokens
-        )
+        return [{"role": "system", "content": prompt}]
+    
+    def _parse_enhancement(self, response: str, conversations: List[Dict]) -> List[Dict]:
+        """Parse enhanced conversations, falling back to the originals on failure"""
+        verbose = os.environ.get('SDK_VERBOSE', 'false').lower() == 'true'
         
         # Parse response
         enhanced_conversations = self.parse_json_output(response)
@@ -270,6 +265,37 @@ class COTGenerator:
         
         return enhanced_conversations
     
+    def enhance_with_cot(self, conversations: List[Dict], include_simple_steps: bool = False) -> List[Dict]:
+        """Enhance existing conversations with CoT reasoning"""
+        messages = self._build_enhancement_messages(conversations, include_simple_steps)
+        
+        # Generate enhanced conversations
+        temperature = self.generation_config.get("temperature", 0.2)
+        max_tokens = self.generation_config.get("max_tokens", 4096)
+        
+        response = self.client.chat_completion(
+            messages, 
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        
+        return self._parse_enhancement(response, conversations)
+    
+    async def aenhance_with_cot(self, conversations: List[Dict], include_simple_steps: bool = False) -> List[Dict]:
+        """Async variant of enhance_with_cot, so many conversations can be enhanced concurrently"""
+        messages = self._build_enhancement_messages(conversations, include_simple_steps)
+        
+        temperature = self.generation_config.get("temperature", 0.2)
+        max_tokens = self.generation_config.get("max_tokens", 4096)
+        
+        response = await self.client.achat_completion(
+            messages,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        
+        return self._parse_enhancement(response, conversations)
+    
     def process_document(self, document_text: str, num_examples: int = None, include_simple_steps: bool = False) -> Dict[str, Any]:
         """Process a document to generate CoT examples"""
         verbose = os.environ.get('SDK_VERBOSE', 'false').lower() == 'true'
@@ -22,9 +22,15 @@ class MultimodalQAGenerator:
         self.generation_config = get_generation_config(self.config)
 
     def generate_qa_pairs(self, documents, num_pairs=25, verbose=False):
-        # Concatenate all text and collect all images (if any)
-        all_text = " ".join([doc["text"] for doc in documents])
-        images = [doc.get("image", None) for doc in documents]
+        # Concatenate all text and keep the first image (if any) in a single pass,
+        # so `documents` may be a one-shot iterator over a streamed dataset
+        texts = []
+        image = None
+        for doc in documents:
+            texts.append(doc["text"])
+            if image is None:
+                image = doc.get("image", None)
+        all_text = " ".join(texts)
         # Chunk the text
         chunk_size = self.generation_config.get("chunk_size", 4000)
         overlap = self.generation_config.get("overlap", 200)
@@ -37,7 +43,6 @@ class MultimodalQAGenerator:
         for i, chunk in enumerate(chunks):
             user_content = []
             user_content.append({"type": "text", "text": f"Passage: {chunk}"})
-            image = next((img for img in images if img is not None), None)
             if image is not None:
                 image_b64 = base64.b64encode(image).decode("utf-8")
                 user_content.append({
@@ -82,7 +87,7 @@ class MultimodalQAGenerator:
         return all_qa_pairs[:num_pairs]
 
     def process_dataset(self, documents, output_dir: str, num_examples=None, verbose=False, base_name: str = "multimodal_qa_pairs") -> str:
-        # documents: list of dicts with 'text' and 'image'
+        # documents: iterable of dicts with 'text' and 'image'
         qa_pairs = self.generate_qa_pairs(documents, num_examples or 25, verbose=verbose)
         output_path = os.path.join(output_dir, f"{base_name}.json")
         with open(output_path, "w", encoding="utf-8") as f:
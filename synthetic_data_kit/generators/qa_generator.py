@@ -5,7 +5,8 @@
 # the root directory of this source tree.
 # Create QA Pairs
 
-from typing import Dict, List, Any, Optional, Tuple
+from typing import AsyncIterator, Dict, Iterable, List, Any, Optional, Tuple
+import asyncio
 import json
 import time
 import os
@@ -14,7 +15,7 @@ from rich.progress import Progress, BarColumn, TextColumn, TimeElapsedColumn, Ti
 
 from synthetic_data_kit.models.llm_client import LLMClient
 from synthetic_data_kit.utils.text import split_into_chunks
-from synthetic_data_kit.utils.llm_processing import parse_qa_pairs, parse_ratings, convert_to_conversation_format
+from synthetic_data_kit.utils.llm_processing import parse_qa_pairs, parse_batched_qa_pairs, parse_ratings, convert_to_conversation_format
 from synthetic_data_kit.utils.config import load_config, get_generation_config, get_curate_config, get_prompt
 
 class QAGenerator:
@@ -30,6 +31,9 @@ class QAGenerator:
         # Get specific configurations
         self.generation_config = get_generation_config(self.config)
         self.curate_config = get_curate_config(self.config)
+        
+        # Requests that failed during the last agenerate_qa_pairs_stream run
+        self.failed_requests = 0
     
     def generate_summary(self, 
                          document_text: str, 
@@ -81,6 +85,99 @@ class QAGenerator:
             print(f"Summary generated ({len(summary)} chars)")
         return summary
     
+    async def agenerate_summary(self,
+                                document_text: str,
+                                rolling_summary: Optional[bool] = False) -> str:
+        """Async variant of generate_summary; rolling chunk summaries run concurrently"""
+        verbose = os.environ.get('SDK_VERBOSE', 'false').lower() == 'true'
+        if verbose:
+            print("Generating document summary...")
+
+        prompt = get_prompt(self.config, "summary")
+        max_context_length = self.generation_config.get("max_context_length", 8000)
+        summary_overlap = self.generation_config.get("summary_overlap", 0)
+
+        if rolling_summary:
+            chunks = split_into_chunks(document_text,
+                                       chunk_size=max_context_length,
+                                       overlap=summary_overlap)
+            summary_per_chunk = await self._gather_completions(
+                [[{"role": "system", "content": prompt},
+                  {"role": "user", "content": chunk}] for chunk in chunks],
+                temperature=0.1
+            )
+            summary = " .".join(summary_per_chunk)
+            # Summarize again to reduce overall length and redundancy
+            summary = await self.agenerate_summary(summary, rolling_summary=False)
+        else:
+            messages = [
+                {"role": "system", "content": prompt},
+                {"role": "user", "content": document_text[0:max_context_length]}
+            ]
+            summary = await self.client.achat_completion(messages, temperature=0.1)
+
+        if verbose:
+            print(f"Summary generated ({len(summary)} chars)")
+        return summary
+
+    def _build_qa_messages(self,
+                           chunks: List[str],
+                           summary: str,
+                           pairs_per_chunk: int,
+                           chunks_per_request: int = 1) -> List[List[Dict[str, str]]]:
+        """Build the QA generation message lists, one per request
+        
+        With `chunks_per_request` > 1, consecutive chunks are packed into one
+        request using the `qa_generation_batch` prompt.
+        """
+        if chunks_per_request <= 1:
+            qa_prompt_template = get_prompt(self.config, "qa_generation")
+            all_messages = []
+            for chunk in chunks:
+                # Format the prompt with summary and text
+                qa_prompt = qa_prompt_template.format(
+                    num_pairs=pairs_per_chunk,
+                    summary=summary[:100],
+                    text=chunk
+                )
+                all_messages.append([{"role": "system", "content": qa_prompt}])
+            return all_messages
+        
+        qa_prompt_template = get_prompt(self.config, "qa_generation_batch")
+        all_messages = []
+        for start in range(0, len(chunks), chunks_per_request):
+            group = chunks[start:start + chunks_per_request]
+            documents = "\n\n".join(
+                f"<DOC{i}>\n{chunk}\n</DOC{i}>" for i, chunk in enumerate(group, 1)
+            )
+            qa_prompt = qa_prompt_template.format(
+                num_docs=len(group),
+                num_pairs=pairs_per_chunk,
+                summary=summary[:100],
+                documents=documents
+            )
+            all_messages.append([{"role": "system", "content": qa_prompt}])
+        return all_messages
+
+    @staticmethod
+    def _parse_qa_response(response: str, chunks_per_request: int) -> List[Dict[str, str]]:
+        """Parse the QA pairs of one request built by `_build_qa_messages`"""
+        if chunks_per_request <= 1:
+            return parse_qa_pairs(response)
+        return parse_batched_qa_pairs(response)
+
+    async def _gather_completions(self,
+                                  message_batches: List[List[Dict[str, str]]],
+                                  temperature: Optional[float] = None) -> List[str]:
+        """Send all message sets concurrently, bounded by `llm_concurrency`"""
+        semaphore = asyncio.Semaphore(self.generation_config.get("llm_concurrency", 16))
+
+        async def complete(messages):
+            async with semaphore:
+                return await self.client.achat_completion(messages, temperature=temperature)
+
+        return await asyncio.gather(*(complete(messages) for messages in message_batches))
+
     def generate_qa_pairs(self, 
                         document_text: str, 
                         summary: str, 
@@ -93,6 +190,7 @@ class QAGenerator:
         temperature = self.generation_config.get("temperature", 0.7)
         overlap = self.generation_config.get("overlap", 200)
         batch_size = self.generation_config.get("batch_size", 32)
+        chunks_per_request = self.generation_config.get("chunks_per_request", 1)
         
         # Split text into chunks
         chunks = split_into_chunks(
@@ -109,23 +207,8 @@ class QAGenerator:
         all_qa_pairs = []
         pairs_per_chunk = max(1, round(num_pairs / len(chunks)))
         
-        # Get QA generation prompt template
-        qa_prompt_template = get_prompt(self.config, "qa_generation")
-        
         # Prepare all message batches
-        all_messages = []
-        for i, chunk in enumerate(chunks):
-            # Format the prompt with summary and text
-            qa_prompt = qa_prompt_template.format(
-                num_pairs=pairs_per_chunk,
-                summary=summary[:100],
-                text=chunk
-            )
-            
-            messages = [
-                {"role": "system", "content": qa_prompt}
-            ]
-            all_messages.append(messages)
+        all_messages = self._build_qa_messages(chunks, summary, pairs_per_chunk, chunks_per_request)
         
         print(f"Processing {len(chunks)} chunks to generate QA pairs...")
         
@@ -142,32 +225,32 @@ class QAGenerator:
             ]
             
             progress_ctx = Progress(*progress_columns)
-            generate_task = progress_ctx.add_task(f"Generating QA pairs", total=len(chunks))
+            generate_task = progress_ctx.add_task(f"Generating QA pairs", total=len(all_messages))
             progress_ctx.start()
         else:
             progress_ctx = None
             generate_task = None
         
         # Process in batches
-        for batch_start in range(0, len(chunks), batch_size):
+        for batch_start in range(0, len(all_messages), batch_size):
             # Check if we've already generated enough pairs
             if len(all_qa_pairs) >= num_pairs:
                 if verbose:
                     print(f"Reached target of {num_pairs} pairs. Stopping processing.")
                 break
                 
-            batch_end = min(batch_start + batch_size, len(chunks))
+            batch_end = min(batch_start + batch_size, len(all_messages))
             batch_messages = all_messages[batch_start:batch_end]
             current_batch_size = len(batch_messages)
             
             batch_num = batch_start//batch_size + 1
-            total_batches = (len(chunks) + batch_size - 1)//batch_size
+            total_batches = (len(all_messages) + batch_size - 1)//batch_size
             
             # Simple progress indicator for non-verbose mode
             if not verbose:
                 print(f"Processing batch {batch_num}/{total_batches}...", end="\r")
             else:
-                print(f"Processing batch {batch_num}/{total_batches} with {current_batch_size} chunks")
+                print(f"Processing batch {batch_num}/{total_batches} with {current_batch_size} requests")
             
             try:
                 # Process the batch
@@ -186,7 +269,7 @@ class QAGenerator:
                         break
                         
                     chunk_index = batch_start + j
-                    chunk_pairs = parse_qa_pairs(response)
+                    chunk_pairs = self._parse_qa_response(response, chunks_per_request)
                     
                     # Only add pairs up to the target limit
                     remaining_pairs = num_pairs - len(all_qa_pairs)
@@ -230,6 +313,80 @@ class QAGenerator:
         print(f"Generated {len(all_qa_pairs)} QA pairs total (requested: {num_pairs})")
         return all_qa_pairs
     
+    async def agenerate_qa_pairs_stream(self,
+                                        document_text: str,
+                                        summary: str,
+                                        num_pairs: int = 25) -> AsyncIterator[Dict[str, str]]:
+        """Yield QA pairs as chunk responses arrive, in chunk order
+
+        All chunk requests are scheduled up front (bounded by `llm_concurrency`);
+        requests still pending once `num_pairs` pairs were produced are cancelled.
+        Failed requests are skipped and counted in `self.failed_requests`.
+        """
+        verbose = os.environ.get('SDK_VERBOSE', 'false').lower() == 'true'
+
+        chunk_size = self.generation_config.get("chunk_size", 4000)
+        temperature = self.generation_config.get("temperature", 0.7)
+        overlap = self.generation_config.get("overlap", 200)
+        concurrency = self.generation_config.get("llm_concurrency", 16)
+        chunks_per_request = self.generation_config.get("chunks_per_request", 1)
+
+        chunks = split_into_chunks(
+            document_text,
+            chunk_size=chunk_size,
+            overlap=overlap
+        )
+        if verbose:
+            print(f"Generating QA pairs...")
+            print(f"Document split into {len(chunks)} chunks")
+            print(f"Using concurrency of {concurrency}")
+
+        pairs_per_chunk = max(1, round(num_pairs / len(chunks)))
+        all_messages = self._build_qa_messages(chunks, summary, pairs_per_chunk, chunks_per_request)
+
+        print(f"Processing {len(chunks)} chunks to generate QA pairs...")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def complete(messages):
+            async with semaphore:
+                return await self.client.achat_completion(messages, temperature=temperature)
+
+        tasks = [asyncio.ensure_future(complete(messages)) for messages in all_messages]
+        generated = 0
+        self.failed_requests = 0
+        try:
+            # Await in chunk order so results match the sequential path
+            for request_index, task in enumerate(tasks):
+                remaining_pairs = num_pairs - generated
+                if remaining_pairs <= 0:
+                    break
+                try:
+                    response = await task
+                except Exception as e:
+                    # Skip the failed request, as the batched path does, and keep going
+                    self.failed_requests += 1
+                    if verbose:
+                        print(f"  Error processing request {request_index+1}: {str(e)}")
+                    continue
+                pairs_to_add = self._parse_qa_response(response, chunks_per_request)[:remaining_pairs]
+                generated += len(pairs_to_add)
+                if verbose:
+                    print(f"  Generated {len(pairs_to_add)} pairs from request {request_index+1} (total: {generated}/{num_pairs})")
+                for pair in pairs_to_add:
+                    yield pair
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        print(f"Generated {generated} QA pairs total (requested: {num_pairs})")
+
+    async def agenerate_qa_pairs(self,
+                                 document_text: str,
+                                 summary: str,
+                                 num_pairs: int = 25) -> List[Dict[str, str]]:
+        """Generate QA pairs with one concurrent LLM request per chunk"""
+        return [pair async for pair in self.agenerate_qa_pairs_stream(document_text, summary, num_pairs)]
+
     def rate_qa_pairs(self, 
                     qa_pairs: List[Dict[str, str]], 
                     summary: str, 
@@ -319,11 +476,11 @@ class QAGenerator:
         return rated_pairs, metrics
     
     def process_documents(self,
-                        documents: List[Dict[str, Any]],
+                        documents: Iterable[Dict[str, Any]],
                         num_pairs: int = 25,
                         verbose: bool = False,
                         rolling_summary: Optional[bool] = False) -> Dict[str, Any]:
-        """Process a list of documents to generate QA pairs without rating"""
+        """Process an iterable of documents to generate QA pairs without rating"""
         # Set the verbose environment variable
         if verbose:
             os.environ['SDK_VERBOSE'] = 'true'
@@ -347,4 +504,43 @@ class QAGenerator:
             "qa_pairs": all_qa_pairs
         }
 
-        return result
\ No newline at end of file
+        return result
+
+    async def aprocess_documents_stream(self,
+                                        documents: Iterable[Dict[str, Any]],
+                                        num_pairs: int = 25,
+                                        verbose: bool = False,
+                                        rolling_summary: Optional[bool] = False
+                                        ) -> Tuple[str, AsyncIterator[Dict[str, str]]]:
+        """Generate the summary, then return it with an async iterator over QA pairs
+
+        Lets callers write each pair as soon as it is produced instead of holding
+        the full result in memory.
+        """
+        # Set the verbose environment variable
+        if verbose:
+            os.environ['SDK_VERBOSE'] = 'true'
+        else:
+            os.environ['SDK_VERBOSE'] = 'false'
+
+        full_text = " ".join([doc["text"] for doc in documents])
+
+        summary = await self.agenerate_summary(full_text, rolling_summary=rolling_summary)
+        return summary, self.agenerate_qa_pairs_stream(full_text, summary, num_pairs=num_pairs)
+
+    async def aprocess_documents(self,
+                                 documents: Iterable[Dict[str, Any]],
+                                 num_pairs: int = 25,
+                                 verbose: bool = False,
+                                 rolling_summary: Optional[bool] = False) -> Dict[str, Any]:
+        """Async variant of process_documents that fans LLM requests out concurrently"""
+        summary, qa_pairs = await self.aprocess_documents_stream(
+            documents,
+            num_pairs=num_pairs,
+            verbose=verbose,
+            rolling_summary=rolling_summary
+        )
+        return {
+            "summary": summary,
+            "qa_pairs": [pair async for pair in qa_pairs]
+        }
@@ -4,4 +4,5 @@
 # This source code is licensed under the terms described in the LICENSE file in
 # the root directory of this source tree.
 # vLLM client. We will expand to Cerebras, ollama. See RFC for more details
-from synthetic_data_kit.models.llm_client import LLMClient
\ No newline at end of file
+from synthetic_data_kit.models.llm_client import LLMClient
+from synthetic_data_kit.models.cached_llm_client import CachedLLMClient
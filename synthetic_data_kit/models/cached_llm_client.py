@@ -0,0 +1,317 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the terms described in the LICENSE file in
+# the root directory of this source tree.
+# Response cache in front of LLMClient: exact-match lookups plus optional semantic lookups
+from typing import List, Dict, Any, Optional
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import string
+import threading
+
+from synthetic_data_kit.models.llm_client import LLMClient
+
+logger = logging.getLogger(__name__)
+
+# Semantic lookups need an embedding model and a vector index; both are optional
+try:
+    import faiss
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
+
+
+class CachedLLMClient:
+    """Wraps an LLMClient and reuses stored responses for repeated requests
+
+    Responses are keyed by SHA-256 of the model, sampling parameters and messages
+    and stored in a SQLite file under `cache_dir`. With `semantic=True`, a miss on
+    the exact key falls back to the closest previously seen prompt (cosine
+    similarity of sentence embeddings) for the same model and sampling parameters.
+
+    With `refresh=True`, lookups always miss but responses are still stored,
+    replacing the cached ones.
+
+    Any attribute not defined here is delegated to the wrapped client, so the
+    wrapper can be passed anywhere an LLMClient is expected.
+    """
+
+    def __init__(self,
+                 client: LLMClient,
+                 cache_dir: str,
+                 semantic: bool = False,
+                 similarity_threshold: float = 0.95,
+                 embedding_model: str = "all-MiniLM-L6-v2",
+                 refresh: bool = False):
+        """Initialize the cache around an existing LLM client
+
+        Args:
+            client: LLM client used on cache misses
+            cache_dir: Directory holding the cache database
+            semantic: Whether to fall back to embedding similarity on exact misses
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            embedding_model: Sentence-transformer model used to embed prompts
+            refresh: Send every request to the model and overwrite the cached responses
+        """
+        self.client = client
+        self.cache_dir = cache_dir
+        self.refresh = refresh
+        self.similarity_threshold = similarity_threshold
+        self.embedding_model = embedding_model
+
+        if semantic and not SEMANTIC_CACHE_AVAILABLE:
+            logger.warning("Semantic LLM cache requires 'sentence-transformers' and 'faiss-cpu'; "
+                           "falling back to exact-match caching only")
+            semantic = False
+        self.semantic = semantic
+
+        # Opened lazily so constructing the wrapper never touches the filesystem
+        self._conn = None
+        self._lock = threading.Lock()
+        self._encoder = None
+        self._indexes = {}
+
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._conn = sqlite3.connect(os.path.join(self.cache_dir, "responses.db"),
+                                         check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, scope TEXT, vector BLOB)")
+            self._conn.commit()
+        return self._conn
+
+    def _scope(self, temperature, max_tokens, top_p) -> str:
+        """Hash of everything except the messages; semantic hits must match it exactly
+
+        Unset sampling parameters are resolved from the config the same way
+        LLMClient resolves them, so changing the config invalidates old entries.
+        """
+        generation_config = self.client.config.get('generation', {})
+        payload = json.dumps({
+            "provider": self.client.provider,
+            "api_base": self.client.api_base,
+            "model": self.client.model,
+            "temperature": temperature if temperature is not None else generation_config.get('temperature', 0.1),
+            "max_tokens": max_tokens if max_tokens is not None else generation_config.get('max_tokens', 4096),
+            "top_p": top_p if top_p is not None else generation_config.get('top_p', 0.95),
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _key(scope: str, messages: List[Dict[str, Any]]) -> str:
+        payload = scope + json.dumps(messages, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _template_fields(text: str, template: str) -> Optional[List[str]]:
+        """Return the values substituted into `template` to produce `text`, or None if it doesn't match"""
+        # Literal text around each field; escaped braces split literals into several parts
+        literals = [""]
+        for literal, field, _, _ in string.Formatter().parse(template):
+            literals[-1] += literal
+            if field is not None:
+                literals.append("")
+        if len(literals) < 2 or not text.startswith(literals[0]):
+            return None
+
+        values = []
+        position = len(literals[0])
+        for i, following in enumerate(literals[1:], start=1):
+            if i == len(literals) - 1:
+                # Last field: everything up to the template's closing literal
+                end = len(text) - len(following)
+                if not text.endswith(following) or end < position:
+                    return None
+            else:
+                end = text.find(following, position)
+                if end == -1:
+                    return None
+            values.append(text[position:end])
+            position = end + len(following)
+        return values
+
+    def _prompt_text(self, messages: List[Dict[str, Any]]) -> Optional[str]:
+        """Text to embed for semantic lookups, or None if the request must not be matched semantically
+
+        Prompts built from a configured template are reduced to the values
+        substituted into it: the fixed template text would otherwise dominate
+        (and, past the encoder's input limit, hide) the content that differs
+        between requests. Requests with non-text content (images) are never
+        matched semantically.
+        """
+        templates = [template for template in self.client.config.get('prompts', {}).values()
+                     if isinstance(template, str)]
+        parts = []
+        for message in messages:
+            content = message.get("content")
+            if isinstance(content, list):
+                if any(not isinstance(part, dict) or part.get("type") != "text" for part in content):
+                    return None
+                content = "\n".join(part.get("text", "") for part in content)
+            if not isinstance(content, str):
+                continue
+            for template in templates:
+                values = self._template_fields(content, template)
+                if values is not None:
+                    content = "\n".join(values)
+                    break
+            parts.append(content)
+        return "\n".join(parts)
+
+    def _embed(self, text: str):
+        if self._encoder is None:
+            with self._lock:
+                if self._encoder is None:
+                    self._encoder = SentenceTransformer(self.embedding_model)
+        vector = self._encoder.encode([text], normalize_embeddings=True)
+        return np.asarray(vector, dtype="float32")
+
+    def _index(self, scope: str):
+        """Load the vector index for a scope from the database on first use"""
+        if scope not in self._indexes:
+            rows = self._connect().execute(
+                "SELECT key, vector FROM embeddings WHERE scope = ?", (scope,)).fetchall()
+            index, keys = None, []
+            for key, blob in rows:
+                vector = np.frombuffer(blob, dtype="float32").reshape(1, -1)
+                if index is None:
+                    index = faiss.IndexFlatIP(vector.shape[1])
+                index.add(vector)
+                keys.append(key)
+            self._indexes[scope] = (index, keys)
+        return self._indexes[scope]
+
+    def _lookup(self, scope: str, key: str, messages: List[Dict[str, Any]]):
+        """Return (response, vector); vector is reused by _store on a semantic miss
+
+        The lock only guards the database and the indexes; the prompt is embedded
+        outside it so concurrent lookups don't queue behind one encoder call.
+        """
+        if not self.refresh:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                return row[0], None
+        if not self.semantic:
+            return None, None
+        text = self._prompt_text(messages)
+        if not text:
+            return None, None
+
+        vector = self._embed(text)
+        if self.refresh:
+            return None, vector
+        with self._lock:
+            index, keys = self._index(scope)
+            if index is not None and index.ntotal > 0:
+                scores, ids = index.search(vector, 1)
+                if scores[0][0] >= self.similarity_threshold:
+                    row = self._connect().execute("SELECT response FROM responses WHERE key = ?",
+                                                  (keys[ids[0][0]],)).fetchone()
+                    if row is not None:
+                        return row[0], None
+        return None, vector
+
+    def _store(self, scope: str, key: str, response: str, vector=None) -> None:
+        # Failed async requests come back as "ERROR: ..." strings; never cache those
+        if not isinstance(response, str) or response.startswith("ERROR:"):
+            return
+        with self._lock:
+            conn = self._connect()
+            conn.execute("INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)",
+                         (key, response))
+            if vector is not None:
+                conn.execute("INSERT OR REPLACE INTO embeddings (key, scope, vector) VALUES (?, ?, ?)",
+                             (key, scope, vector.tobytes()))
+                index, keys = self._index(scope)
+                if index is None:
+                    index = faiss.IndexFlatIP(vector.shape[1])
+                    self._indexes[scope] = (index, keys)
+                index.add(vector)
+                keys.append(key)
+            conn.commit()
+
+    def chat_completion(self,
+                        messages: List[Dict[str, str]],
+                        temperature: float = None,
+                        max_tokens: int = None,
+                        top_p: float = None) -> str:
+        """Cached LLMClient.chat_completion"""
+        scope = self._scope(temperature, max_tokens, top_p)
+        key = self._key(scope, messages)
+        response, vector = self._lookup(scope, key, messages)
+        if response is not None:
+            return response
+
+        response = self.client.chat_completion(messages, temperature=temperature,
+                                               max_tokens=max_tokens, top_p=top_p)
+        self._store(scope, key, response, vector)
+        return response
+
+    async def achat_completion(self,
+                               messages: List[Dict[str, str]],
+                               temperature: float = None,
+                               max_tokens: int = None,
+                               top_p: float = None) -> str:
+        """Cached LLMClient.achat_completion
+
+        Cache reads and writes (and embedding, in semantic mode) block, so they
+        run in the default executor to keep concurrent requests on the event loop moving.
+        """
+        loop = asyncio.get_running_loop()
+        scope = self._scope(temperature, max_tokens, top_p)
+        key = self._key(scope, messages)
+        response, vector = await loop.run_in_executor(None, self._lookup, scope, key, messages)
+        if response is not None:
+            return response
+
+        response = await self.client.achat_completion(messages, temperature=temperature,
+                                                      max_tokens=max_tokens, top_p=top_p)
+        await loop.run_in_executor(None, self._store, scope, key, response, vector)
+        return response
+
+    def batch_completion(self,
+                         message_batches: List[List[Dict[str, str]]],
+                         temperature: float = None,
+                         max_tokens: int = None,
+                         top_p: float = None,
+                         batch_size: int = None) -> List[str]:
+        """Cached LLMClient.batch_completion; only cache misses are sent to the model"""
+        scope = self._scope(temperature, max_tokens, top_p)
+        results: List[Optional[str]] = [None] * len(message_batches)
+        misses = []
+        for i, messages in enumerate(message_batches):
+            key = self._key(scope, messages)
+            response, vector = self._lookup(scope, key, messages)
+            if response is not None:
+                results[i] = response
+            else:
+                misses.append((i, key, vector))
+
+        if misses:
+            responses = self.client.batch_completion(
+                [message_batches[i] for i, _, _ in misses],
+                temperature=temperature,
+                max_tokens=max_tokens,
+                top_p=top_p,
+                batch_size=batch_size
+            )
+            for (i, key, vector), response in zip(misses, responses):
+                self._store(scope, key, response, vector)
+                results[i] = response
+
+        return results
@@ -6,11 +6,14 @@
 # Supports both vLLM and API endpoint (including OpenAI-compatible) providers
 from typing import List, Dict, Any, Optional, Union, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 import os
 import logging
 import asyncio
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from synthetic_data_kit.utils.config import load_config, get_vllm_config, get_openai_config, get_llm_provider
@@ -51,6 +54,13 @@ class LLMClient:
         # Load config
         self.config = load_config(config_path)
         
+        # Created on first async vLLM request
+        self._executor = None
+        # AsyncOpenAI clients, one per event loop, created on first async API request
+        self._async_clients = weakref.WeakKeyDictionary()
+        # Pooled HTTP connections for vLLM requests, created on first request
+        self._session = None
+        
         # Determine provider (with CLI override taking precedence)
         self.provider = provider or get_llm_provider(self.config)
         
@@ -118,6 +128,19 @@ class LLMClient:
         
         self.openai_client = OpenAI(**client_kwargs)
     
+    def _get_session(self) -> requests.Session:
+        """Return the HTTP session for vLLM requests, keeping connections alive between them
+        
+        Its pool holds one connection per concurrent request (`llm_concurrency`).
+        """
+        if self._session is None:
+            pool_size = self.config.get('generation', {}).get('llm_concurrency', 16)
+            self._session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+        return self._session
+    
     def _check_vllm_server(self) -> tuple:
         """Check if the VLLM server is running and accessible"""
         try:
@@ -156,7 +179,62 @@ class LLMClient:
             return self._openai_chat_completion(messages, temperature, max_tokens, top_p, verbose)
         else:  # Default to vLLM
             return self._vllm_chat_completion(messages, temperature, max_tokens, top_p, verbose)
-    
+
+    async def achat_completion(self,
+                               messages: List[Dict[str, str]],
+                               temperature: float = None,
+                               max_tokens: int = None,
+                               top_p: float = None) -> str:
+        """Generate a chat completion without blocking the event loop
+
+        Lets callers fan out many requests with asyncio.gather. The API endpoint
+        provider uses the AsyncOpenAI client; vLLM requests run in a thread pool
+        sized to `generation.llm_concurrency`. Like chat_completion, raises once
+        all retries have failed.
+
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            temperature: Sampling temperature (higher = more random)
+            max_tokens: Maximum tokens to generate
+            top_p: Nucleus sampling parameter
+
+        Returns:
+            String containing the generated text
+        """
+        # Get defaults from config if not provided
+        generation_config = self.config.get('generation', {})
+        temperature = temperature if temperature is not None else generation_config.get('temperature', 0.1)
+        max_tokens = max_tokens if max_tokens is not None else generation_config.get('max_tokens', 4096)
+        top_p = top_p if top_p is not None else generation_config.get('top_p', 0.95)
+
+        verbose = os.environ.get('SDK_VERBOSE', 'false').lower() == 'true'
+
+        if self.provider == 'api-endpoint':
+            debug_mode = os.environ.get('SDK_DEBUG', 'false').lower() == 'true'
+            return await self._process_message_async(
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                top_p=top_p,
+                verbose=verbose,
+                debug_mode=debug_mode,
+                raise_on_failure=True
+            )
+        else:  # Default to vLLM
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_executor(),
+                self._vllm_chat_completion,
+                messages, temperature, max_tokens, top_p, verbose
+            )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Thread pool for blocking vLLM requests, one thread per allowed concurrent request"""
+        if self._executor is None:
+            max_workers = self.config.get('generation', {}).get('llm_concurrency', 16)
+            self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="llm-request")
+        return self._executor
+
     def _openai_chat_completion(self, 
                               messages: List[Dict[str, str]],
                               temperature: float,
@@ -300,7 +378,7 @@ class LLMClient:
                 if verbose:
                     logger.info(f"Sending request to vLLM model {self.model}...")
                 
-                response = requests.post(
+                response = self._get_session().post(
                     f"{self.api_base}/chat/completions",
                     headers={"Content-Type": "application/json"},
                     data=json.dumps(data),
@@ -343,27 +421,56 @@ class LLMClient:
         else:  # Default to vLLM
             return self._vllm_batch_completion(message_batches, temperature, max_tokens, top_p, batch_size, verbose)
     
+    def _get_async_openai_client(self):
+        """Return the AsyncOpenAI client for the running event loop, creating it on first use
+        
+        Async clients hold a connection pool bound to the loop that created them,
+        so one is kept per loop rather than one per request or one per LLMClient;
+        `aclose` releases it before the loop exits.
+        """
+        loop = asyncio.get_running_loop()
+        async_client = self._async_clients.get(loop)
+        if async_client is None:
+            try:
+                from openai import AsyncOpenAI
+            except ImportError:
+                raise ImportError("The 'openai' package is required for this functionality. Please install it using 'pip install openai>=1.0.0'.")
+            
+            client_kwargs = {}
+            if self.api_key:
+                client_kwargs['api_key'] = self.api_key
+            if self.api_base:
+                client_kwargs['base_url'] = self.api_base
+            
+            async_client = AsyncOpenAI(**client_kwargs)
+            self._async_clients[loop] = async_client
+        return async_client
+    
+    async def aclose(self):
+        """Close the AsyncOpenAI client of the running event loop, if one was created
+        
+        Call before the loop exits (e.g. at the end of the coroutine passed to
+        asyncio.run); connections left open are otherwise only dropped when the
+        client is garbage-collected, after their loop has closed.
+        """
+        async_client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if async_client is not None:
+            await async_client.close()
+    
     async def _process_message_async(self, 
                                     messages: List[Dict[str, str]], 
                                     temperature: float,
                                     max_tokens: int,
                                     top_p: float,
                                     verbose: bool,
-                                    debug_mode: bool):
-        """Process a single message set asynchronously using the OpenAI API"""
-        try:
-            from openai import AsyncOpenAI
-        except ImportError:
-            raise ImportError("The 'openai' package is required for this functionality. Please install it using 'pip install openai>=1.0.0'.")
+                                    debug_mode: bool,
+                                    raise_on_failure: bool = False):
+        """Process a single message set asynchronously using the OpenAI API
         
-        # Initialize the async OpenAI client
-        client_kwargs = {}
-        if self.api_key:
-            client_kwargs['api_key'] = self.api_key
-        if self.api_base:
-            client_kwargs['base_url'] = self.api_base
-            
-        async_client = AsyncOpenAI(**client_kwargs)
+        Once all retries fail, returns an "ERROR: ..." string, or raises if
+        `raise_on_failure` is set.
+        """
+        async_client = self._get_async_openai_client()
         
         for attempt in range(self.max_retries):
             try:
@@ -479,6 +586,8 @@ class LLMClient:
                     logger.error(f"{self.provider} API error (attempt {attempt+1}/{self.max_retries}): {str(e)}")
                 
                 if attempt == self.max_retries - 1:
+                    if raise_on_failure:
+                        raise Exception(f"Failed to get {self.provider} completion after {self.max_retries} attempts: {str(e)}")
                     return f"ERROR: {str(e)}"
                 
                 await asyncio.sleep(self.retry_delay * (attempt + 1))  # Exponential backoff
@@ -521,7 +630,10 @@ class LLMClient:
                     tasks.append(task)
                 
                 # Process all messages in the batch concurrently
-                return await asyncio.gather(*tasks)
+                try:
+                    return await asyncio.gather(*tasks)
+                finally:
+                    await self.aclose()
             
             # Run the async batch processing
             batch_results = asyncio.run(process_batch())
@@ -568,7 +680,7 @@ class LLMClient:
                     if verbose:
                         logger.info(f"Sending batch request to vLLM model {self.model}...")
                     
-                    response = requests.post(
+                    response = self._get_session().post(
                         f"{self.api_base}/chat/completions",
                         headers={"Content-Type": "application/json"},
                         data=json.dumps(request_data),
@@ -4,7 +4,11 @@
 # This source code is licensed under the terms described in the LICENSE file in
 # the root directory of this source tree.
 
+import asyncio
 import io
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Any
 
 import fitz  # PyMuPDF
@@ -15,6 +19,54 @@ import os
 import docx
 from pptx import Presentation
 
+# Below this many pages per worker, process start-up costs more than it saves
+MIN_PAGES_PER_WORKER = 16
+
+_page_pool = None
+_page_pool_lock = threading.Lock()
+
+
+def _get_page_pool() -> ProcessPoolExecutor:
+    """Process pool shared by every `aparse` call, so concurrent files never exceed cpu_count workers.
+
+    Workers are spawned rather than forked: the parent is multithreaded (event
+    loop, executors), and forking it can deadlock on locks held by other threads.
+    """
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is None:
+            _page_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1,
+                                             mp_context=multiprocessing.get_context("spawn"))
+        return _page_pool
+
+
+def _extract_pdf_pages(file_path: str, start: int, stop: int) -> List[Dict[str, Any]]:
+    """Extract text and images for pages [start, stop) of a PDF.
+
+    Module-level so it can run in a worker process; each call opens its own
+    document because PyMuPDF objects cannot be shared across threads or processes.
+    """
+    doc = fitz.open(file_path)
+    data = []
+
+    for page_num in range(start, stop):
+        page = doc.load_page(page_num)
+        text = page.get_text()
+        image_list = page.get_images(full=True)
+
+        if not image_list:
+            data.append({"text": text, "image": None})
+
+        for img_index, img in enumerate(image_list):
+            xref = img[0]
+            base_image = doc.extract_image(xref)
+            image_bytes = base_image["image"]
+            data.append({"text": text, "image": image_bytes})
+
+    doc.close()
+    return data
+
+
 class MultimodalParser:
     def parse(self, file_path: str) -> List[Dict[str, Any]]:
         """
@@ -37,25 +89,43 @@ class MultimodalParser:
         else:
             raise ValueError(f"Unsupported file extension for multimodal parsing: {ext}")
 
-    def _parse_pdf(self, file_path: str) -> List[Dict[str, Any]]:
-        doc = fitz.open(file_path)
-        data = []
+    async def aparse(self, file_path: str) -> List[Dict[str, Any]]:
+        """
+        Parses a file like `parse`, without blocking the event loop.
 
-        for page_num in range(len(doc)):
-            page = doc.load_page(page_num)
-            text = page.get_text()
-            image_list = page.get_images(full=True)
+        Large PDFs are split into page ranges extracted in a shared pool of
+        worker processes; other files are parsed in the default thread pool executor.
 
-            if not image_list:
-                data.append({"text": text, "image": None})
+        Args:
+            file_path (str): The path to the file.
 
-            for img_index, img in enumerate(image_list):
-                xref = img[0]
-                base_image = doc.extract_image(xref)
-                image_bytes = base_image["image"]
-                data.append({"text": text, "image": image_bytes})
+        Returns:
+            List[Dict[str, Any]]: The same pages, in the same order, as `parse`.
+        """
+        loop = asyncio.get_running_loop()
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext != ".pdf":
+            return await loop.run_in_executor(None, self.parse, file_path)
+
+        with fitz.open(file_path) as doc:
+            page_count = len(doc)
+        workers = min(os.cpu_count() or 1, page_count // MIN_PAGES_PER_WORKER)
+        if workers <= 1:
+            return await loop.run_in_executor(None, self._parse_pdf, file_path)
+
+        pages_per_worker = -(-page_count // workers)  # ceiling division
+        pool = _get_page_pool()
+        ranges = await asyncio.gather(*(
+            loop.run_in_executor(pool, _extract_pdf_pages, file_path, start,
+                                 min(start + pages_per_worker, page_count))
+            for start in range(0, page_count, pages_per_worker)
+        ))
+        return [item for page_range in ranges for item in page_range]
 
-        return data
+    def _parse_pdf(self, file_path: str) -> List[Dict[str, Any]]:
+        with fitz.open(file_path) as doc:
+            page_count = len(doc)
+        return _extract_pdf_pages(file_path, 0, page_count)
 
     def _parse_docx(self, file_path: str) -> List[Dict[str, Any]]:
         doc = docx.Document(file_path)
@@ -10,6 +10,7 @@ from synthetic_data_kit.utils.config import (
     get_vllm_config, 
     get_generation_config,
     get_curate_config,
+    get_llm_cache_config,
     get_format_config,
     get_prompt,
     merge_configs,
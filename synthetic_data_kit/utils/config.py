@@ -126,6 +126,15 @@ def get_curate_config(config: Dict[str, Any]) -> Dict[str, Any]:
         'temperature': 0.1
     })
 
+def get_llm_cache_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Get LLM response cache configuration"""
+    return config.get('llm_cache', {
+        'enabled': True,
+        'semantic': False,
+        'similarity_threshold': 0.95,
+        'embedding_model': 'all-MiniLM-L6-v2'
+    })
+
 def get_format_config(config: Dict[str, Any]) -> Dict[str, Any]:
     """Get format configuration"""
     return config.get('format', {
@@ -5,6 +5,7 @@
 # the root directory of this source tree.
 # Directory processing utilities for batch operations
 
+import asyncio
 import os
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Callable
@@ -77,7 +78,7 @@ def process_directory_ingest(
     Returns:
         Dictionary with processing results
     """
-    from synthetic_data_kit.core.ingest import process_file
+    from synthetic_data_kit.core.ingest import aprocess_files
     
     # Get all supported files
     supported_files = get_supported_files(directory, INGEST_EXTENSIONS)
@@ -117,12 +118,25 @@ def process_directory_ingest(
         
         task = progress.add_task("Processing files", total=len(supported_files))
         
-        for file_path in supported_files:
+        # Parse files concurrently, advancing the bar as each one finishes;
+        # results come back in input order
+        ingest_config = (config or {}).get("ingest", {})
+        outputs = asyncio.run(aprocess_files(
+            supported_files,
+            output_dir,
+            config=config,
+            multimodal=multimodal,
+            max_concurrency=ingest_config.get("max_concurrency", 8),
+            max_workers=ingest_config.get("parse_processes"),
+            on_complete=lambda _: progress.update(task, advance=1)
+        ))
+        
+        for file_path, output_path in zip(supported_files, outputs):
             filename = os.path.basename(file_path)
             
             try:
-                # Process individual file
-                output_path = process_file(file_path, output_dir, None, config, multimodal=multimodal)
+                if isinstance(output_path, Exception):
+                    raise output_path
                 
                 # Record success
                 results["successful"] += 1
@@ -150,8 +164,6 @@ def process_directory_ingest(
                     console.print(f"✗ Failed to process {filename}: {e}", style="red")
                 else:
                     console.print(f"✗ {filename}: {e}", style="red")
-            
-            progress.update(task, advance=1)
     
     # Show summary
     console.print("\n" + "="*50, style="bold")
@@ -223,6 +235,7 @@ def process_directory_create(
     provider: Optional[str] = None,
     chunk_size: Optional[int] = None,
     chunk_overlap: Optional[int] = None,
+    force: bool = False,
 ) -> Dict[str, Any]:
     """Process all supported files in directory for content creation
     
@@ -236,6 +249,7 @@ def process_directory_create(
         num_pairs: Target number of QA pairs or examples
         verbose: Show detailed progress
         provider: LLM provider to use
+        force: Regenerate outputs even if they are up to date, bypassing cached LLM responses
     
     Returns:
         Dictionary with processing results
@@ -310,7 +324,8 @@ def process_directory_create(
                     verbose,
                     provider=provider,
                     chunk_size=chunk_size,
-                    chunk_overlap=chunk_overlap
+                    chunk_overlap=chunk_overlap,
+                    force=force
                 )
                 
                 # Record success
@@ -6,31 +6,150 @@
 
 import lance
 import pyarrow as pa
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Union
+import itertools
 import os
+import queue
+import threading
+
+class PrefetchQueue:
+    """Iterate over an iterable while a background thread fetches items ahead.
+
+    Up to `maxsize` items are produced ahead of the consumer, so decoding the next
+    Lance batch (which releases the GIL) overlaps with work on the current one.
+    Exceptions raised by the producer are re-raised in the consumer.
+    """
+
+    _DONE = object()
+
+    def __init__(self, iterable: Iterable[Any], maxsize: int = 2):
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._stop = threading.Event()
+        self._finished = False
+        self._thread = threading.Thread(target=self._fill, args=(iterable,), daemon=True)
+        self._thread.start()
+
+    def _put(self, item: Any) -> bool:
+        # Poll so the producer exits promptly once the consumer calls close()
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _fill(self, iterable: Iterable[Any]) -> None:
+        try:
+            for item in iterable:
+                if not self._put((item, None)):
+                    return
+        except BaseException as e:
+            self._put((None, e))
+            return
+        self._put((self._DONE, None))
+
+    def __iter__(self) -> "PrefetchQueue":
+        return self
+
+    def __next__(self) -> Any:
+        if self._finished:
+            raise StopIteration
+        item, error = self._queue.get()
+        if error is not None or item is self._DONE:
+            self._finished = True
+            if error is not None:
+                raise error
+            raise StopIteration
+        return item
+
+    def close(self) -> None:
+        """Stop the background thread without draining the remaining items"""
+        self._finished = True
+        self._stop.set()
+
+# Rows converted to Arrow per write batch; bounds the memory held for image bytes
+WRITE_BATCH_SIZE = 256
+# Rows per data file in the written dataset
+MAX_ROWS_PER_FILE = 100_000
+
+def _with_binary_compression(schema: pa.Schema) -> pa.Schema:
+    """Mark binary fields for zstd compression by the Lance file writer"""
+    fields = []
+    for field in schema:
+        if pa.types.is_binary(field.type) or pa.types.is_large_binary(field.type):
+            metadata = dict(field.metadata or {})
+            metadata.setdefault(b"lance-encoding:compression", b"zstd")
+            field = field.with_metadata(metadata)
+        fields.append(field)
+    return pa.schema(fields, metadata=schema.metadata)
+
+def _record_batches(
+    data: Iterable[Any],
+    schema: Optional[pa.Schema],
+    batch_size: int
+) -> Iterator[pa.RecordBatch]:
+    """Group row dictionaries into RecordBatches; RecordBatches are passed through"""
+    rows = []
+    for item in data:
+        if isinstance(item, pa.RecordBatch):
+            if rows:
+                yield pa.RecordBatch.from_pylist(rows, schema=schema)
+                rows = []
+            yield item
+            continue
+        rows.append(item)
+        if len(rows) >= batch_size:
+            yield pa.RecordBatch.from_pylist(rows, schema=schema)
+            rows = []
+    if rows:
+        yield pa.RecordBatch.from_pylist(rows, schema=schema)
 
 def create_lance_dataset(
-    data: List[Dict[str, Any]],
+    data: Iterable[Union[Dict[str, Any], pa.RecordBatch]],
     output_path: str,
-    schema: Optional[pa.Schema] = None
+    schema: Optional[pa.Schema] = None,
+    batch_size: int = WRITE_BATCH_SIZE,
+    max_rows_per_file: int = MAX_ROWS_PER_FILE
 ) -> None:
-    """Create a Lance dataset from a list of dictionaries.
+    """Create a Lance dataset from rows or RecordBatches.
+
+    Rows are converted and written `batch_size` at a time, so only one batch
+    of Arrow data is held in memory during the write. Binary columns (images)
+    are stored with zstd compression.
 
     Args:
-        data (List[Dict[str, Any]]): A list of dictionaries, where each dictionary represents a row.
+        data (Iterable[Union[Dict[str, Any], pa.RecordBatch]]): Dictionaries, one per row,
+            or RecordBatches. May be a one-shot iterator.
         output_path (str): The path to save the Lance dataset.
-        schema (Optional[pa.Schema], optional): The PyArrow schema. If not provided, it will be inferred. Defaults to None.
+        schema (Optional[pa.Schema], optional): The PyArrow schema. If not provided, it will be
+            inferred from the first batch. Defaults to None.
+        batch_size (int, optional): Rows per RecordBatch when converting dictionaries.
+            Defaults to 256.
+        max_rows_per_file (int, optional): Maximum rows per Lance data file. Defaults to 100,000.
     """
-    if not data:
+    batches = _record_batches(data, schema, batch_size)
+    first = next(batches, None)
+    if first is None:
         return
 
+    schema = _with_binary_compression(schema or first.schema)
+    reader = pa.RecordBatchReader.from_batches(
+        schema,
+        (batch.cast(schema) for batch in itertools.chain([first], batches))
+    )
+
     # Ensure the output directory exists
-    output_dir = os.path.dirname(output_path)
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-    table = pa.Table.from_pylist(data, schema=schema)
-    lance.write_dataset(table, output_path, mode="overwrite")
+    lance.write_dataset(
+        reader,
+        output_path,
+        schema=schema,
+        mode="overwrite",
+        data_storage_version="2.1",
+        max_rows_per_file=max_rows_per_file
+    )
 
 def load_lance_dataset(
     dataset_path: str
@@ -46,3 +165,79 @@ def load_lance_dataset(
     if not os.path.exists(dataset_path):
         return None
     return lance.dataset(dataset_path)
+
+def _binary_views(column: pa.Array) -> List[Optional[memoryview]]:
+    """Slice one memoryview per value straight from a binary column's offsets and data buffers.
+
+    Avoids creating an Arrow scalar per row, which costs more than copying small values.
+    """
+    _, offsets, data = column.buffers()
+    offsets = memoryview(offsets).cast("q" if pa.types.is_large_binary(column.type) else "i")
+    offsets = offsets[column.offset:column.offset + len(column) + 1].tolist()
+    data = memoryview(data) if data is not None else memoryview(b"")
+    if column.null_count:
+        valid = column.is_valid().to_pylist()
+        return [data[start:end] if is_valid else None
+                for start, end, is_valid in zip(offsets, offsets[1:], valid)]
+    return [data[start:end] for start, end in zip(offsets, offsets[1:])]
+
+def _column_values(column: pa.Array) -> List[Any]:
+    """Convert an Arrow column to Python values.
+
+    Binary values are returned as memoryviews over the Arrow buffer instead of
+    copied into bytes objects.
+    """
+    if pa.types.is_binary(column.type) or pa.types.is_large_binary(column.type):
+        return _binary_views(column)
+    return column.to_pylist()
+
+def _batch_rows(batch: pa.RecordBatch) -> Iterator[Dict[str, Any]]:
+    """Yield the rows of a RecordBatch, converting each column as a whole"""
+    names = batch.schema.names
+    for values in zip(*(_column_values(column) for column in batch.columns)):
+        yield dict(zip(names, values))
+
+def iter_lance_rows(
+    dataset_path: str,
+    columns: Optional[List[str]] = None,
+    batch_size: Optional[int] = None,
+    prefetch: int = 2
+) -> Iterator[Dict[str, Any]]:
+    """Stream the rows of a Lance dataset as dictionaries.
+
+    Rows are decoded one Arrow RecordBatch at a time, so the full table is
+    never materialized in memory. While the caller consumes a batch, the next
+    `prefetch` batches are read on a background thread. Only the requested
+    columns are read, and binary columns are yielded as zero-copy memoryviews.
+
+    Args:
+        dataset_path (str): The path to the Lance dataset.
+        columns (Optional[List[str]], optional): Columns to read. Columns missing from the
+            dataset are skipped. Defaults to None (all columns).
+        batch_size (Optional[int], optional): Rows per RecordBatch. Defaults to Lance's default.
+        prefetch (int, optional): Batches to decode ahead of the consumer; 0 disables
+            prefetching. Defaults to 2.
+
+    Yields:
+        Dict[str, Any]: One dictionary per row.
+    """
+    dataset = load_lance_dataset(dataset_path)
+    if dataset is None:
+        raise FileNotFoundError(f"Lance dataset not found: {dataset_path}")
+
+    if columns is not None:
+        columns = [column for column in columns if column in dataset.schema.names]
+
+    scanner = dataset.scanner(columns=columns, batch_size=batch_size)
+    batches = scanner.to_reader()
+    if prefetch <= 0:
+        for batch in batches:
+            yield from _batch_rows(batch)
+        return
+
+    prefetched = PrefetchQueue(batches, maxsize=prefetch)
+    try:
+        for batch in prefetched:
+            yield from _batch_rows(batch)
+    finally:
+        prefetched.close()
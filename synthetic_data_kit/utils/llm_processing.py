@@ -7,6 +7,7 @@
 import re
 import json
 import os
+import orjson
 from typing import List, Dict, Any, Optional
 
 def parse_qa_pairs(text: str) -> List[Dict[str, str]]:
@@ -64,6 +65,32 @@ def parse_qa_pairs(text: str) -> List[Dict[str, str]]:
     
     return pairs
 
+def parse_batched_qa_pairs(text: str) -> List[Dict[str, str]]:
+    """Parse QA pairs from a response covering several chunks
+    
+    The expected output is an array with one array of pairs per chunk; pairs are
+    returned flattened in chunk order. A single flat array of pairs is accepted too.
+    """
+    start = text.find('[')
+    end = text.rfind(']') + 1
+    groups = None
+    if start != -1 and end > start:
+        try:
+            groups = orjson.loads(text[start:end])
+        except orjson.JSONDecodeError:
+            pass
+    if not isinstance(groups, list):
+        # Fall back to the lenient single-chunk parser
+        groups = parse_qa_pairs(text)
+    
+    pairs = []
+    for group in groups:
+        if isinstance(group, list):
+            pairs.extend(pair for pair in group if isinstance(pair, dict))
+        elif isinstance(group, dict):
+            pairs.append(group)
+    return pairs
+
 def parse_ratings(text: str, original_items: List[Dict[str, str]] = None) -> List[Dict[str, Any]]:
     """Parse rated items from LLM output
     
@@ -13,6 +13,16 @@ import pytest
 from tests.utils import TempDirectoryManager
 
 
+@pytest.fixture(autouse=True)
+def clear_llm_client_cache():
+    """Keep LLM clients (often mocks) from leaking between tests through the client cache."""
+    from synthetic_data_kit.core import create
+
+    create._get_llm_client.cache_clear()
+    yield
+    create._get_llm_client.cache_clear()
+
+
 @pytest.fixture
 def sample_data_path():
     """Fixture providing path to the sample data directory."""
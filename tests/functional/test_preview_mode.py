@@ -1,6 +1,7 @@
 """Functional tests for preview mode across all CLI commands."""
 
 import os
+import shutil
 import tempfile
 import json
 from unittest.mock import patch
@@ -191,6 +192,8 @@ def test_preview_mode_single_file_warning(patch_config):
     with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
         f.write("Test content")
         temp_file = f.name
+    # The single file is still processed, so keep its output out of the default data/ dirs
+    output_dir = tempfile.mkdtemp()
         
     try:
         # Test preview mode with single file
@@ -198,11 +201,12 @@ def test_preview_mode_single_file_warning(patch_config):
         from typer.testing import CliRunner
         
         runner = CliRunner()
-        result = runner.invoke(app, ['ingest', temp_file, '--preview'])
+        result = runner.invoke(app, ['ingest', temp_file, '--preview', '--output-dir', output_dir])
         
         # Should show warning that preview is only for directories
         assert result.exit_code == 0
         assert "Preview mode is only available for directories" in result.stdout
         
     finally:
-        os.unlink(temp_file)
\ No newline at end of file
+        os.unlink(temp_file)
+        shutil.rmtree(output_dir, ignore_errors=True)
\ No newline at end of file
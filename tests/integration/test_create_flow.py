@@ -1,8 +1,11 @@
 """Integration tests for the create workflow."""
 
+import asyncio
+import json
 import os
+import shutil
 import tempfile
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -10,8 +13,9 @@ from synthetic_data_kit.core import create
 
 
 @pytest.mark.integration
-def test_process_file(patch_config, test_env):
-    """Test processing a file to generate QA pairs."""
+@pytest.mark.parametrize("from_running_loop", [False, True])
+def test_process_file(patch_config, test_env, from_running_loop):
+    """Test processing a file to generate QA pairs, also from inside an event loop."""
     with tempfile.NamedTemporaryFile(mode="w+", delete=False) as f:
         f.write("This is sample text content for testing QA pair generation.")
         input_path = f.name
@@ -24,30 +28,35 @@ def test_process_file(patch_config, test_env):
         with patch("synthetic_data_kit.core.create.LLMClient") as mock_llm_client_class:
             # Setup mock LLM client
             mock_llm_client = MagicMock()
+            mock_llm_client.aclose = AsyncMock()
             mock_llm_client_class.return_value = mock_llm_client
 
             # Mock QAGenerator with simplified behavior
             with patch("synthetic_data_kit.core.create.QAGenerator") as mock_qa_gen_class:
                 # Create a mock generator that returns a predefined document
                 mock_generator = MagicMock()
-                mock_generator.process_documents.return_value = {
-                    "summary": "A sample text for testing.",
-                    "qa_pairs": [
-                        {"question": "What is this?", "answer": "This is sample text."},
-                        {"question": "What is it for?", "answer": "For testing QA generation."},
-                    ],
-                }
+                qa_pairs = [
+                    {"question": "What is this?", "answer": "This is sample text."},
+                    {"question": "What is it for?", "answer": "For testing QA generation."},
+                ]
+
+                async def stream_pairs():
+                    for pair in qa_pairs:
+                        yield pair
+
+                mock_generator.aprocess_documents_stream = AsyncMock(
+                    return_value=("A sample text for testing.", stream_pairs())
+                )
                 mock_qa_gen_class.return_value = mock_generator
 
-                # Mock file operations
-                with patch("builtins.open", create=True), patch("json.dump") as mock_json_dump:
-                    # Mock os.path.exists to return True for our output file
-                    with patch("os.path.exists", return_value=True), patch(
-                        "os.path.join",
-                        return_value=os.path.join(output_dir, "output_qa_pairs.json"),
-                    ):
-                        # Run the process_file function with minimal arguments
-                        output_path = create.process_file(
+                with patch(
+                    "synthetic_data_kit.core.create.write_qa_pairs_stream",
+                    new_callable=AsyncMock,
+                    return_value=len(qa_pairs),
+                ) as mock_write_stream:
+                    # Run the process_file function with minimal arguments
+                    def run():
+                        return create.process_file(
                             file_path=input_path,
                             output_dir=output_dir,
                             config_path=None,
@@ -59,27 +68,293 @@ def test_process_file(patch_config, test_env):
                             provider="api-endpoint",
                         )
 
-                        # Verify function doesn't raise an exception
-                        assert output_path is not None
+                    async def run_in_loop():
+                        return run()
+
+                    output_path = asyncio.run(run_in_loop()) if from_running_loop else run()
 
-                        # Verify the LLM client was created
-                        mock_llm_client_class.assert_called_once()
+                    # Verify function doesn't raise an exception
+                    assert output_path is not None
 
-                        # Verify QA generator was created and used
-                        mock_qa_gen_class.assert_called_once()
-                        mock_generator.process_documents.assert_called_once()
+                    # Verify the LLM client was created
+                    mock_llm_client_class.assert_called_once()
 
-                        # Verify data was written to a file
-                        mock_json_dump.assert_called()
+                    # Verify QA generator was created and used
+                    mock_qa_gen_class.assert_called_once()
+                    mock_generator.aprocess_documents_stream.assert_awaited_once()
+
+                    # Verify data was written to a file
+                    mock_write_stream.assert_awaited_once()
 
     finally:
         # Clean up temporary files
         if os.path.exists(input_path):
             os.unlink(input_path)
-        try:
-            os.rmdir(output_dir)
-        except:
-            pass
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+@pytest.mark.integration
+def test_process_file_summary_writes_json(patch_config, test_env, tmp_path):
+    """Test that the summary output is written as indented, valid JSON."""
+    input_path = tmp_path / "doc.txt"
+    input_path.write_text("Café documents need summaries too.", encoding="utf-8")
+    output_dir = tmp_path / "generated"
+
+    with patch("synthetic_data_kit.core.create.LLMClient") as mock_llm_client_class, patch(
+        "synthetic_data_kit.core.create.QAGenerator"
+    ) as mock_qa_gen_class:
+        mock_llm_client_class.return_value = MagicMock()
+        mock_qa_gen_class.return_value.generation_config = {}
+        mock_qa_gen_class.return_value.generate_summary.return_value = "Un résumé."
+
+        output_path = create.process_file(
+            file_path=str(input_path),
+            output_dir=str(output_dir),
+            content_type="summary",
+            provider="api-endpoint",
+        )
+
+    with open(output_path, encoding="utf-8") as f:
+        raw = f.read()
+    assert json.loads(raw) == {"summary": "Un résumé."}
+    assert raw.startswith('{\n  "summary"')
+
+
+@pytest.mark.integration
+def test_process_file_skips_unchanged_input(patch_config, test_env, tmp_path):
+    """Test that an unchanged input is not regenerated, and a changed one is."""
+    input_path = tmp_path / "doc.txt"
+    input_path.write_text("First version of the document.", encoding="utf-8")
+    output_dir = tmp_path / "generated"
+
+    with patch("synthetic_data_kit.core.create.LLMClient") as mock_llm_client_class, patch(
+        "synthetic_data_kit.core.create.QAGenerator"
+    ) as mock_qa_gen_class:
+        mock_llm_client_class.return_value = MagicMock()
+        mock_qa_gen_class.return_value.generation_config = {}
+        generate_summary = mock_qa_gen_class.return_value.generate_summary
+        generate_summary.return_value = "A summary."
+
+        def run():
+            return create.process_file(
+                file_path=str(input_path),
+                output_dir=str(output_dir),
+                content_type="summary",
+                provider="api-endpoint",
+            )
+
+        first = run()
+        assert run() == first
+        assert generate_summary.call_count == 1
+        assert os.path.exists(first + ".meta")
+
+        input_path.write_text("Second version of the document.", encoding="utf-8")
+        run()
+        assert generate_summary.call_count == 2
+
+
+@pytest.mark.integration
+def test_process_file_skip_does_not_build_client(patch_config, test_env, tmp_path):
+    """Test that an up-to-date output is returned before building a client, unless forced."""
+    input_path = tmp_path / "doc.txt"
+    input_path.write_text("The document.", encoding="utf-8")
+    output_dir = tmp_path / "generated"
+
+    with patch("synthetic_data_kit.core.create.LLMClient") as mock_llm_client_class, patch(
+        "synthetic_data_kit.core.create.QAGenerator"
+    ) as mock_qa_gen_class:
+        mock_llm_client_class.return_value = MagicMock()
+        mock_qa_gen_class.return_value.generation_config = {}
+        generate_summary = mock_qa_gen_class.return_value.generate_summary
+        generate_summary.return_value = "A summary."
+
+        def run(**kwargs):
+            return create.process_file(
+                file_path=str(input_path),
+                output_dir=str(output_dir),
+                content_type="summary",
+                provider="api-endpoint",
+                **kwargs,
+            )
+
+        run()
+        create._get_llm_client.cache_clear()
+        run()
+        assert mock_llm_client_class.call_count == 1
+        assert generate_summary.call_count == 1
+
+        run(force=True)
+        assert generate_summary.call_count == 2
+
+
+@pytest.mark.integration
+def test_process_file_failed_requests_not_fingerprinted(patch_config, test_env, tmp_path):
+    """Test that QA output with failed requests is regenerated on the next run."""
+    input_path = tmp_path / "doc.txt"
+    input_path.write_text("The document.", encoding="utf-8")
+    output_dir = tmp_path / "generated"
+
+    with patch("synthetic_data_kit.core.create.LLMClient") as mock_llm_client_class, patch(
+        "synthetic_data_kit.core.create.QAGenerator"
+    ) as mock_qa_gen_class:
+        mock_llm_client_class.return_value = MagicMock()
+        mock_llm_client_class.return_value.aclose = AsyncMock()
+        mock_generator = mock_qa_gen_class.return_value
+
+        async def no_pairs():
+            return
+            yield
+
+        mock_generator.aprocess_documents_stream = AsyncMock(
+            side_effect=lambda *args, **kwargs: ("A summary.", no_pairs())
+        )
+
+        def run():
+            return create.process_file(
+                file_path=str(input_path),
+                output_dir=str(output_dir),
+                content_type="qa",
+                num_pairs=2,
+                provider="api-endpoint",
+            )
+
+        # Every request failed during an endpoint outage
+        mock_generator.failed_requests = 1
+        output_path = run()
+        assert not os.path.exists(output_path + ".meta")
+
+        # Once the endpoint recovers, the file is regenerated rather than skipped
+        mock_generator.failed_requests = 0
+        run()
+        assert mock_generator.aprocess_documents_stream.await_count == 2
+        assert os.path.exists(output_path + ".meta")
+
+
+@pytest.mark.integration
+def test_process_file_cot_verbose_not_skipped(patch_config, test_env, tmp_path):
+    """Test that cot output is regenerated when verbose mode changes its prompt."""
+    input_path = tmp_path / "doc.txt"
+    input_path.write_text("The document.", encoding="utf-8")
+    output_dir = tmp_path / "generated"
+
+    with patch("synthetic_data_kit.core.create.LLMClient") as mock_llm_client_class, patch(
+        "synthetic_data_kit.core.create.COTGenerator"
+    ) as mock_cot_gen_class:
+        mock_llm_client_class.return_value = MagicMock()
+        process_document = mock_cot_gen_class.return_value.process_document
+        process_document.return_value = {
+            "cot_examples": [{"question": "Q?", "reasoning": "Step 1.", "answer": "A."}]
+        }
+
+        def run(verbose):
+            return create.process_file(
+                file_path=str(input_path),
+                output_dir=str(output_dir),
+                content_type="cot",
+                num_pairs=1,
+                verbose=verbose,
+                provider="api-endpoint",
+            )
+
+        run(verbose=False)
+        run(verbose=False)
+        assert process_document.call_count == 1
+
+        run(verbose=True)
+        assert process_document.call_count == 2
+        assert process_document.call_args.kwargs["include_simple_steps"] is True
+
+
+@pytest.mark.integration
+def test_process_file_reuses_llm_client(patch_config, test_env, tmp_path):
+    """Test that the LLM client is built once per distinct settings."""
+    output_dir = tmp_path / "generated"
+    input_paths = []
+    for i in range(3):
+        input_path = tmp_path / f"doc{i}.txt"
+        input_path.write_text(f"Document {i}.", encoding="utf-8")
+        input_paths.append(input_path)
+
+    with patch("synthetic_data_kit.core.create.LLMClient") as mock_llm_client_class, patch(
+        "synthetic_data_kit.core.create.QAGenerator"
+    ) as mock_qa_gen_class:
+        mock_llm_client_class.side_effect = lambda **kwargs: MagicMock(config={})
+        mock_qa_gen_class.return_value.generation_config = {}
+        mock_qa_gen_class.return_value.generate_summary.return_value = "A summary."
+
+        for input_path in input_paths[:2]:
+            create.process_file(
+                file_path=str(input_path), output_dir=str(output_dir), content_type="summary"
+            )
+        assert mock_llm_client_class.call_count == 1
+
+        # A different chunk size changes the client's config, so it gets its own client
+        create.process_file(
+            file_path=str(input_paths[2]),
+            output_dir=str(output_dir),
+            content_type="summary",
+            chunk_size=500,
+        )
+        assert mock_llm_client_class.call_count == 2
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("from_running_loop", [False, True])
+def test_process_file_cot_enhance_concurrent(patch_config, test_env, tmp_path, from_running_loop):
+    """Test that cot-enhance enhances every conversation and keeps input order.
+
+    Also run from inside an event loop, as in a Jupyter notebook.
+    """
+    input_path = tmp_path / "qa.json"
+    input_path.write_text(
+        json.dumps(
+            {
+                "qa_pairs": [
+                    {"question": f"Question {i}?", "answer": f"Answer {i}."} for i in range(5)
+                ]
+            }
+        )
+    )
+
+    async def fake_enhance(messages, temperature=None, max_tokens=None):
+        # Answer the later conversations first to exercise out-of-order completion
+        question = json.loads(messages[0]["content"].split("Conversations:\n", 1)[1])[1]["content"]
+        await asyncio.sleep(0.01 * (5 - int(question.split()[1].rstrip("?"))))
+        # Wrap in an extra list to exercise the nested-response flattening
+        return json.dumps([[{"role": "user", "content": question},
+                            {"role": "assistant", "content": f"Reasoned: {question}"}]])
+
+    mock_llm_client = MagicMock()
+    mock_llm_client.aclose = AsyncMock()
+    mock_llm_client.config = {
+        "llm_cache": {"enabled": False},
+        "generation": {"llm_concurrency": 2},
+        "prompts": {
+            "cot_enhancement": "Steps: {include_simple_steps}\nConversations:\n{conversations}"
+        },
+    }
+    mock_llm_client.achat_completion = AsyncMock(side_effect=fake_enhance)
+
+    def run():
+        return create.process_file(
+            file_path=str(input_path),
+            output_dir=str(tmp_path / "generated"),
+            content_type="cot-enhance",
+        )
+
+    async def run_in_loop():
+        return run()
+
+    with patch("synthetic_data_kit.core.create.LLMClient", return_value=mock_llm_client):
+        output_path = asyncio.run(run_in_loop()) if from_running_loop else run()
+
+    with open(output_path) as f:
+        enhanced = json.load(f)
+
+    assert mock_llm_client.achat_completion.await_count == 5
+    assert [conv["conversations"][1]["content"] for conv in enhanced] == [
+        f"Reasoned: Question {i}?" for i in range(5)
+    ]
 
 
 @pytest.mark.integration
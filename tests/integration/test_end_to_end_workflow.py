@@ -3,7 +3,7 @@
 import json
 import os
 import tempfile
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -60,6 +60,7 @@ def test_complete_workflow(patch_config, test_env):
         with patch("synthetic_data_kit.core.create.LLMClient") as mock_llm_client_class:
             # Setup mock LLM client with config
             mock_llm_client = MagicMock()
+            mock_llm_client.aclose = AsyncMock()
             mock_llm_client.config = {
                 "prompts": {
                     "qa_generation": "Generate question-answer pairs based on this text: {text}",
@@ -71,19 +72,24 @@ def test_complete_workflow(patch_config, test_env):
             with patch("synthetic_data_kit.core.create.QAGenerator") as mock_qa_gen_class:
                 # Create a mock generator that returns predefined QA pairs
                 mock_generator = MagicMock()
-                mock_generator.process_documents.return_value = {
-                    "summary": "A sample document about synthetic data generation.",
-                    "qa_pairs": [
-                        {
-                            "question": "What is the document about?",
-                            "answer": "Synthetic data generation techniques.",
-                        },
-                        {
-                            "question": "Why is synthetic data useful?",
-                            "answer": "It helps in training machine learning models without real data.",
-                        },
-                    ],
-                }
+                qa_pairs = [
+                    {
+                        "question": "What is the document about?",
+                        "answer": "Synthetic data generation techniques.",
+                    },
+                    {
+                        "question": "Why is synthetic data useful?",
+                        "answer": "It helps in training machine learning models without real data.",
+                    },
+                ]
+
+                async def stream_pairs():
+                    for pair in qa_pairs:
+                        yield pair
+
+                mock_generator.aprocess_documents_stream = AsyncMock(
+                    return_value=("A sample document about synthetic data generation.", stream_pairs())
+                )
                 mock_qa_gen_class.return_value = mock_generator
 
                 # Generate QA pairs
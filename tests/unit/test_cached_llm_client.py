@@ -0,0 +1,174 @@
+"""Unit tests for the cached LLM client."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from synthetic_data_kit.models.cached_llm_client import CachedLLMClient
+
+
+@pytest.fixture
+def mock_client():
+    client = MagicMock()
+    client.model = "mock-model"
+    client.provider = "api-endpoint"
+    client.api_base = "http://localhost:8000/v1"
+    client.config = {
+        "generation": {"temperature": 0.1, "max_tokens": 4096, "top_p": 0.95},
+        "prompts": {"qa_generation": "Create {num_pairs} question-answer pairs.\n\nText:\n{text}"},
+    }
+    return client
+
+
+@pytest.mark.unit
+def test_chat_completion_cached_across_instances(mock_client, tmp_path):
+    """Test that identical requests are served from the cache, even after a restart."""
+    mock_client.chat_completion.return_value = "cached response"
+    messages = [{"role": "system", "content": "Summarize this."}]
+
+    cached = CachedLLMClient(mock_client, cache_dir=str(tmp_path))
+    assert cached.chat_completion(messages, temperature=0.1) == "cached response"
+    assert cached.chat_completion(messages, temperature=0.1) == "cached response"
+    assert mock_client.chat_completion.call_count == 1
+
+    # A new wrapper over the same directory reuses the stored response
+    reopened = CachedLLMClient(mock_client, cache_dir=str(tmp_path))
+    assert reopened.chat_completion(messages, temperature=0.1) == "cached response"
+    assert mock_client.chat_completion.call_count == 1
+
+    # Different sampling parameters are a different request
+    reopened.chat_completion(messages, temperature=0.7)
+    assert mock_client.chat_completion.call_count == 2
+
+
+@pytest.mark.unit
+def test_batch_completion_only_sends_misses(mock_client, tmp_path):
+    """Test that batch completion only forwards uncached message sets."""
+    first = [{"role": "system", "content": "first"}]
+    second = [{"role": "system", "content": "second"}]
+    mock_client.chat_completion.return_value = "first response"
+    mock_client.batch_completion.return_value = ["second response"]
+
+    cached = CachedLLMClient(mock_client, cache_dir=str(tmp_path))
+    cached.chat_completion(first)
+
+    results = cached.batch_completion([first, second])
+
+    assert results == ["first response", "second response"]
+    sent = mock_client.batch_completion.call_args[0][0]
+    assert sent == [second]
+
+
+@pytest.mark.unit
+def test_error_responses_not_cached(mock_client, tmp_path):
+    """Test that failed async requests are retried instead of cached."""
+    mock_client.achat_completion = AsyncMock(side_effect=["ERROR: timeout", "ok"])
+    messages = [{"role": "system", "content": "Generate pairs."}]
+
+    cached = CachedLLMClient(mock_client, cache_dir=str(tmp_path))
+    assert asyncio.run(cached.achat_completion(messages)) == "ERROR: timeout"
+    assert asyncio.run(cached.achat_completion(messages)) == "ok"
+    assert asyncio.run(cached.achat_completion(messages)) == "ok"
+    assert mock_client.achat_completion.await_count == 2
+
+
+@pytest.mark.unit
+def test_attributes_delegate_to_client(mock_client, tmp_path):
+    """Test that the wrapper exposes the wrapped client's attributes."""
+    mock_client.config = {"generation": {}}
+
+    cached = CachedLLMClient(mock_client, cache_dir=str(tmp_path))
+
+    assert cached.provider == "api-endpoint"
+    assert cached.config is mock_client.config
+    # Nothing is written until the first lookup
+    assert not any(tmp_path.iterdir())
+
+
+@pytest.mark.unit
+def test_unset_parameters_resolve_to_config_defaults(mock_client, tmp_path):
+    """Test that omitted sampling parameters share a key with their configured values."""
+    mock_client.chat_completion.return_value = "response"
+    messages = [{"role": "system", "content": "Summarize this."}]
+
+    cached = CachedLLMClient(mock_client, cache_dir=str(tmp_path))
+    cached.chat_completion(messages)
+    cached.chat_completion(messages, temperature=0.1, max_tokens=4096, top_p=0.95)
+    assert mock_client.chat_completion.call_count == 1
+
+    # Changing the configured default invalidates the entry
+    mock_client.config["generation"]["temperature"] = 0.7
+    cached.chat_completion(messages)
+    assert mock_client.chat_completion.call_count == 2
+
+
+@pytest.mark.unit
+def test_scope_includes_provider_and_api_base(mock_client, tmp_path):
+    """Test that the same model behind a different endpoint is not served from the cache."""
+    mock_client.chat_completion.return_value = "response"
+    messages = [{"role": "system", "content": "Summarize this."}]
+
+    cached = CachedLLMClient(mock_client, cache_dir=str(tmp_path))
+    cached.chat_completion(messages)
+    mock_client.api_base = "http://other-host:8000/v1"
+    cached.chat_completion(messages)
+    assert mock_client.chat_completion.call_count == 2
+
+
+@pytest.mark.unit
+def test_prompt_text_strips_template(mock_client, tmp_path):
+    """Test that semantic lookups embed only the values substituted into a template."""
+    cached = CachedLLMClient(mock_client, cache_dir=str(tmp_path))
+    prompt = "Create 5 question-answer pairs.\n\nText:\nThe mitochondria is the powerhouse of the cell."
+
+    assert cached._prompt_text([{"role": "system", "content": prompt}]) == \
+        "5\nThe mitochondria is the powerhouse of the cell."
+    # Escaped braces in the template (JSON examples) are literal text
+    mock_client.config["prompts"]["rating"] = 'Return {{"rating": 8}} for:\n{pairs}'
+    assert cached._prompt_text([{"role": "system", "content": 'Return {"rating": 8} for:\nQ1/A1'}]) == "Q1/A1"
+    # Prompts that don't come from a template are embedded whole
+    assert cached._prompt_text([{"role": "user", "content": "free-form question"}]) == "free-form question"
+    # Requests with images are never matched semantically
+    image_message = [{"role": "user", "content": [
+        {"type": "text", "text": "Describe this."},
+        {"type": "image_url", "image_url": {"url": "data:image/png;base64,AAAA"}},
+    ]}]
+    assert cached._prompt_text(image_message) is None
+
+
+@pytest.mark.unit
+def test_refresh_bypasses_and_overwrites_cache(mock_client, tmp_path):
+    """Test that refresh mode asks the model again and replaces the stored response."""
+    messages = [{"role": "system", "content": "Summarize this."}]
+    mock_client.chat_completion.return_value = "old response"
+    CachedLLMClient(mock_client, cache_dir=str(tmp_path)).chat_completion(messages)
+
+    mock_client.chat_completion.return_value = "new response"
+    refreshed = CachedLLMClient(mock_client, cache_dir=str(tmp_path), refresh=True)
+    assert refreshed.chat_completion(messages) == "new response"
+    assert mock_client.chat_completion.call_count == 2
+
+    # Later runs reuse the refreshed response
+    assert CachedLLMClient(mock_client, cache_dir=str(tmp_path)).chat_completion(messages) == "new response"
+    assert mock_client.chat_completion.call_count == 2
+
+
+@pytest.mark.unit
+def test_semantic_lookup_embeds_outside_lock(mock_client, tmp_path):
+    """Test that the prompt is embedded without holding the cache lock."""
+    cached = CachedLLMClient(mock_client, cache_dir=str(tmp_path))
+    cached.semantic = True
+    lock_held = []
+
+    def fake_embed(text):
+        lock_held.append(cached._lock.locked())
+        return "vector"
+
+    cached._embed = fake_embed
+    cached._index = lambda scope: (None, [])
+    scope = cached._scope(None, None, None)
+    messages = [{"role": "user", "content": "free-form question"}]
+
+    assert cached._lookup(scope, cached._key(scope, messages), messages) == (None, "vector")
+    assert lock_held == [False]
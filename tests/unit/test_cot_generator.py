@@ -1,7 +1,8 @@
 """Unit tests for COT Generator."""
 
+import asyncio
 import json
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -317,3 +318,27 @@ def test_process_document(patch_config):
 
     # Check that client was called twice
     assert mock_client.chat_completion.call_count == 2
+
+
+@pytest.mark.unit
+def test_aenhance_with_cot(patch_config):
+    """Test async enhancement uses the async client and falls back on bad output."""
+    mock_client = MagicMock()
+    mock_client.config = {
+        "prompts": {
+            "cot_enhancement": "Include_simple_steps: {include_simple_steps}\n\nConversations:\n{conversations}",
+        },
+        "generation": {},
+    }
+    enhanced_response = [[{"role": "assistant", "content": "Let me think step by step."}]]
+    mock_client.achat_completion = AsyncMock(
+        side_effect=[json.dumps(enhanced_response), "not json"]
+    )
+
+    generator = COTGenerator(client=mock_client)
+    conversations = [{"role": "assistant", "content": "Answer."}]
+
+    assert asyncio.run(generator.aenhance_with_cot(conversations)) == enhanced_response
+    # Unparseable output returns the original conversations
+    assert asyncio.run(generator.aenhance_with_cot(conversations)) == conversations
+    mock_client.chat_completion.assert_not_called()
@@ -0,0 +1,73 @@
+"""Unit tests for the create module."""
+
+import asyncio
+import os
+
+import pytest
+
+from synthetic_data_kit.core import create
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        ({"summary": "s", "qa_pairs": []}, "qa_pairs"),
+        ({"conversations": []}, "single_wrapped"),
+        ([{"conversations": []}, {"conversations": []}], "wrapped_list"),
+        ([], "wrapped_list"),
+        ([{"from": "human", "value": "Hi"}], "msg_list"),
+        ({"other": 1}, "unknown"),
+        ([{"role": "user", "content": "Hi"}], "unknown"),
+    ],
+)
+def test_classify_cot_input(data, expected):
+    """Test routing of the cot-enhance input formats."""
+    assert create._classify_cot_input(data) == expected
+
+
+@pytest.mark.unit
+def test_join_document_text_stops_at_limit():
+    """Test that document texts are joined lazily and only up to the requested length."""
+    consumed = []
+
+    def documents():
+        for text in ["alpha", "beta", "gamma"]:
+            consumed.append(text)
+            yield {"text": text}
+
+    assert create.join_document_text(documents()) == "alpha beta gamma"
+
+    consumed.clear()
+    assert create.join_document_text(documents(), max_chars=8) == "alpha beta"
+    assert consumed == ["alpha", "beta"]
+
+
+@pytest.mark.unit
+def test_write_qa_pairs_stream_matches_write_json(tmp_path):
+    """Test that streamed QA output is byte-identical to writing the full result."""
+    result = {
+        "summary": "Résumé of the document.",
+        "qa_pairs": [
+            {"question": "What is this?", "answer": "This is sample text."},
+            {"question": "What is it for?", "answer": "For testing\nQA generation."},
+        ],
+    }
+
+    async def stream_pairs(pairs):
+        for pair in pairs:
+            yield pair
+
+    for qa_pairs in (result["qa_pairs"], []):
+        expected_path = str(tmp_path / "expected.json")
+        streamed_path = str(tmp_path / "streamed.json")
+        create.write_json(expected_path, {"summary": result["summary"], "qa_pairs": qa_pairs})
+
+        count = asyncio.run(
+            create.write_qa_pairs_stream(streamed_path, result["summary"], stream_pairs(qa_pairs))
+        )
+
+        assert count == len(qa_pairs)
+        with open(expected_path, "rb") as expected, open(streamed_path, "rb") as streamed:
+            assert streamed.read() == expected.read()
+        assert not os.path.exists(streamed_path + ".partial")
@@ -0,0 +1,203 @@
+"""Unit tests for the ingest module."""
+
+import asyncio
+import collections
+import os
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import requests
+
+from synthetic_data_kit.core import ingest
+
+
+@pytest.fixture(autouse=True)
+def clear_pdf_url_cache():
+    ingest._fetch_is_pdf.cache_clear()
+    yield
+    ingest._fetch_is_pdf.cache_clear()
+
+
+@pytest.mark.unit
+def test_check_pdf_url_memoized():
+    """Test that PDF URL checks reuse the shared session and are cached per URL."""
+    response = MagicMock()
+    response.headers = {"Content-Type": "application/pdf"}
+
+    with patch.object(ingest._SESSION, "head", return_value=response) as mock_head:
+        assert ingest._check_pdf_url("https://example.com/paper.pdf") is True
+        assert ingest._check_pdf_url("https://example.com/paper.pdf") is True
+
+        mock_head.assert_called_once_with(
+            "https://example.com/paper.pdf", allow_redirects=True, timeout=5
+        )
+
+
+@pytest.mark.unit
+def test_check_pdf_url_request_error():
+    """Test that network errors are treated as non-PDF content."""
+    with patch.object(ingest._SESSION, "head", side_effect=requests.ConnectionError("down")):
+        assert ingest._check_pdf_url("https://example.com/page") is False
+
+
+@pytest.mark.unit
+def test_check_pdf_url_request_error_not_cached():
+    """Test that a failed check is retried instead of cached as non-PDF."""
+    response = MagicMock()
+    response.headers = {"Content-Type": "application/pdf"}
+
+    with patch.object(
+        ingest._SESSION, "head", side_effect=[requests.ConnectionError("down"), response]
+    ) as mock_head:
+        assert ingest._check_pdf_url("https://example.com/paper.pdf") is False
+        assert ingest._check_pdf_url("https://example.com/paper.pdf") is True
+        assert mock_head.call_count == 2
+
+
+@pytest.mark.unit
+def test_aprocess_files_concurrent_and_ordered():
+    """Test that files are processed concurrently, bounded, and returned in order."""
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fake_process_file(file_path, output_dir, output_name, config, multimodal):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        if file_path == "bad.txt":
+            raise ValueError("unsupported")
+        return f"{output_dir}/{file_path}.lance"
+
+    paths = ["a.txt", "bad.txt", "c.txt", "d.txt", "e.txt"]
+    with patch.object(ingest, "process_file", side_effect=fake_process_file):
+        results = asyncio.run(ingest.aprocess_files(paths, "out", max_concurrency=2))
+
+    assert results[0] == "out/a.txt.lance"
+    assert isinstance(results[1], ValueError)
+    assert results[2:] == ["out/c.txt.lance", "out/d.txt.lance", "out/e.txt.lance"]
+    assert peak == 2
+
+
+@pytest.mark.unit
+def test_aprocess_files_serializes_same_output_name():
+    """Test that inputs sharing an output name never write it concurrently, and run in input order."""
+    active = collections.Counter()
+    overlapped = []
+    order = []
+    lock = threading.Lock()
+
+    def fake_process_file(file_path, output_dir, output_name, config, multimodal):
+        stem = os.path.splitext(file_path)[0]
+        with lock:
+            active[stem] += 1
+            if active[stem] > 1:
+                overlapped.append(stem)
+            order.append(file_path)
+        time.sleep(0.05)
+        with lock:
+            active[stem] -= 1
+        return f"{output_dir}/{stem}.lance"
+
+    paths = ["a.txt", "a.md", "b.txt", "a.html"]
+    with patch.object(ingest, "process_file", side_effect=fake_process_file):
+        results = asyncio.run(ingest.aprocess_files(paths, "out"))
+
+    assert results == ["out/a.lance", "out/a.lance", "out/b.lance", "out/a.lance"]
+    assert overlapped == []
+    assert [path for path in order if path.startswith("a.")] == ["a.txt", "a.md", "a.html"]
+
+
+@pytest.mark.unit
+def test_aprocess_files_reports_each_completion():
+    """Test that on_complete fires per file as it finishes, failures included."""
+    def fake_process_file(file_path, output_dir, output_name, config, multimodal):
+        time.sleep(0.1 if file_path == "slow.txt" else 0)
+        if file_path == "bad.txt":
+            raise ValueError("unsupported")
+        return f"{output_dir}/{file_path}.lance"
+
+    completed = []
+    paths = ["slow.txt", "bad.txt", "fast.txt"]
+    with patch.object(ingest, "process_file", side_effect=fake_process_file):
+        asyncio.run(ingest.aprocess_files(paths, "out", on_complete=completed.append))
+
+    assert sorted(completed) == sorted(paths)
+    assert completed[-1] == "slow.txt"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://www.youtube.com/watch?v=abc123&t=10", "youtube_abc123"),
+        ("https://youtu.be/xyz789", "youtube_xyz789"),
+        ("https://docs.example.com/page", "docs_example_com"),
+    ],
+)
+def test_process_file_url_output_name(url, expected, tmp_path):
+    """Test output names derived from YouTube and web URLs."""
+    parser = MagicMock()
+    parser.parse.return_value = [{"text": "content"}]
+
+    with patch.object(ingest, "determine_parser", return_value=parser):
+        output_path = ingest.process_file(url, str(tmp_path))
+
+    assert output_path == str(tmp_path / f"{expected}.lance")
+
+
+@pytest.mark.unit
+def test_process_file_multimodal_from_running_loop(tmp_path):
+    """Test that multimodal ingest works when called from inside an event loop, as in Jupyter."""
+    parser = MagicMock()
+    parser.aparse = AsyncMock(return_value=[{"text": "page", "image": None}])
+
+    async def ingest_in_loop():
+        return ingest.process_file("doc.pdf", str(tmp_path), multimodal=True)
+
+    with patch.object(ingest, "determine_parser", return_value=parser):
+        output_path = asyncio.run(ingest_in_loop())
+
+    assert output_path == str(tmp_path / "doc.lance")
+    parser.aparse.assert_awaited_once_with("doc.pdf")
+
+
+@pytest.mark.unit
+def test_aprocess_files_routes_cpu_bound_files_to_processes():
+    """Test that local PDF/DOCX/PPTX files use the process pool and everything else threads."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    executors = {}
+
+    def fake_process_file(file_path, output_dir, output_name, config, multimodal):
+        executors[file_path] = threading.current_thread().name
+        return f"{output_dir}/{file_path}.lance"
+
+    paths = ["a.pdf", "b.txt", "c.DOCX", "https://example.com/d.pdf"]
+    with patch.object(ingest, "process_file", side_effect=fake_process_file), patch.object(
+        ingest,
+        "ProcessPoolExecutor",
+        side_effect=lambda **kwargs: ThreadPoolExecutor(thread_name_prefix="process-pool"),
+    ) as mock_pool:
+        results = asyncio.run(ingest.aprocess_files(paths, "out"))
+
+    assert results == [f"out/{path}.lance" for path in paths]
+    assert mock_pool.call_args.kwargs["max_workers"] <= 2
+    assert executors["a.pdf"].startswith("process-pool")
+    assert executors["c.DOCX"].startswith("process-pool")
+    assert not executors["b.txt"].startswith("process-pool")
+    assert not executors["https://example.com/d.pdf"].startswith("process-pool")
+
+    # Multimodal mode and max_workers=0 keep every file in threads
+    with patch.object(ingest, "process_file", side_effect=fake_process_file), patch.object(
+        ingest, "ProcessPoolExecutor"
+    ) as mock_pool:
+        asyncio.run(ingest.aprocess_files(paths, "out", multimodal=True))
+        asyncio.run(ingest.aprocess_files(paths, "out", max_workers=0))
+    mock_pool.assert_not_called()
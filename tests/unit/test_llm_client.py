@@ -1,6 +1,7 @@
 """Unit tests for LLM client."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -93,7 +94,7 @@ def test_llm_client_chat_completion(patch_config, test_env):
 @pytest.mark.unit
 def test_llm_client_vllm_chat_completion(patch_config, test_env):
     """Test LLM client chat completion with vLLM provider."""
-    with patch("requests.post") as mock_post, patch("requests.get") as mock_get:
+    with patch("requests.Session.post") as mock_post, patch("requests.get") as mock_get:
         # Mock vLLM server check
         mock_check_response = MagicMock()
         mock_check_response.status_code = 200
@@ -123,3 +124,134 @@ def test_llm_client_vllm_chat_completion(patch_config, test_env):
         assert response == "This is a test response"
         # Check that vLLM API was called
         assert mock_post.called
+
+
+@pytest.mark.unit
+def test_llm_client_vllm_achat_completion(patch_config, test_env):
+    """Test async chat completion with vLLM provider."""
+    with patch("requests.Session.post") as mock_post, patch("requests.get") as mock_get:
+        mock_check_response = MagicMock()
+        mock_check_response.status_code = 200
+        mock_check_response.json.return_value = ["mock-model"]
+        mock_get.return_value = mock_check_response
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "choices": [{"message": {"content": "This is a test response"}}]
+        }
+        mock_post.return_value = mock_response
+
+        client = LLMClient(provider="vllm")
+
+        messages = [{"role": "user", "content": "What is synthetic data?"}]
+        response = asyncio.run(client.achat_completion(messages, temperature=0.7))
+
+        assert response == "This is a test response"
+        assert mock_post.called
+
+
+@pytest.mark.unit
+def test_llm_client_achat_completion_raises_after_retries(patch_config, test_env):
+    """Test that async chat completion raises, like chat_completion, when all retries fail."""
+    with patch("synthetic_data_kit.models.llm_client.OpenAI"), patch(
+        "openai.AsyncOpenAI"
+    ) as mock_async_openai, patch("asyncio.sleep", new=AsyncMock()):
+        mock_async_openai.return_value.chat.completions.create = AsyncMock(
+            side_effect=RuntimeError("endpoint unavailable")
+        )
+
+        client = LLMClient(provider="api-endpoint")
+        messages = [{"role": "user", "content": "What is synthetic data?"}]
+
+        with pytest.raises(Exception, match="endpoint unavailable"):
+            asyncio.run(client.achat_completion(messages))
+
+        create = mock_async_openai.return_value.chat.completions.create
+        assert create.await_count == client.max_retries
+
+
+@pytest.mark.unit
+def test_llm_client_vllm_executor_sized_to_concurrency(patch_config, test_env):
+    """Test that async vLLM requests get a thread pool sized to llm_concurrency."""
+    with patch("requests.get") as mock_get:
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = ["mock-model"]
+
+        client = LLMClient(provider="vllm")
+        client.config.setdefault("generation", {})["llm_concurrency"] = 24
+
+        executor = client._get_executor()
+        assert executor._max_workers == 24
+        assert client._get_executor() is executor
+
+
+@pytest.mark.unit
+def test_llm_client_reuses_async_client_per_event_loop(patch_config, test_env):
+    """Test that one AsyncOpenAI client serves every request on the same event loop."""
+    with patch("synthetic_data_kit.models.llm_client.OpenAI"), patch(
+        "openai.AsyncOpenAI"
+    ) as mock_async_openai:
+        completion = MagicMock()
+        completion.choices = [MagicMock()]
+        completion.choices[0].message.content = "This is a test response"
+        mock_async_openai.return_value.chat.completions.create = AsyncMock(return_value=completion)
+
+        client = LLMClient(provider="api-endpoint")
+        messages = [{"role": "user", "content": "What is synthetic data?"}]
+
+        async def run_requests():
+            return await asyncio.gather(*(client.achat_completion(messages) for _ in range(3)))
+
+        assert asyncio.run(run_requests()) == ["This is a test response"] * 3
+        assert mock_async_openai.call_count == 1
+
+        # A new event loop gets its own client
+        asyncio.run(client.achat_completion(messages))
+        assert mock_async_openai.call_count == 2
+
+
+@pytest.mark.unit
+def test_llm_client_vllm_reuses_session(patch_config, test_env):
+    """Test that vLLM requests share one pooled HTTP session."""
+    with patch("requests.Session.post") as mock_post, patch("requests.get") as mock_get:
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = ["mock-model"]
+        mock_post.return_value.json.return_value = {
+            "choices": [{"message": {"content": "This is a test response"}}]
+        }
+
+        client = LLMClient(provider="vllm")
+        messages = [{"role": "user", "content": "What is synthetic data?"}]
+        client.chat_completion(messages)
+        session = client._session
+        client.batch_completion([messages, messages])
+
+        assert client._session is session
+        assert mock_post.call_count == 3
+        adapter = session.get_adapter(client.api_base)
+        assert adapter._pool_maxsize == client.config["generation"].get("llm_concurrency", 16)
+
+
+@pytest.mark.unit
+def test_llm_client_aclose_closes_loop_client(patch_config, test_env):
+    """Test that aclose closes the event loop's AsyncOpenAI client before the loop exits."""
+    with patch("synthetic_data_kit.models.llm_client.OpenAI"), patch(
+        "openai.AsyncOpenAI"
+    ) as mock_async_openai:
+        completion = MagicMock()
+        completion.choices = [MagicMock()]
+        completion.choices[0].message.content = "This is a test response"
+        mock_async_openai.return_value.chat.completions.create = AsyncMock(return_value=completion)
+        mock_async_openai.return_value.close = AsyncMock()
+
+        client = LLMClient(provider="api-endpoint")
+        messages = [{"role": "user", "content": "What is synthetic data?"}]
+
+        async def run_requests():
+            await client.achat_completion(messages)
+            await client.aclose()
+
+        asyncio.run(run_requests())
+        mock_async_openai.return_value.close.assert_awaited_once()
+        assert len(client._async_clients) == 0
@@ -84,3 +84,24 @@ def test_convert_to_conversation_format():
 
     # Check second conversation
     assert conversations[1][1]["content"] == "Why use synthetic data?"
+
+
+@pytest.mark.unit
+def test_parse_batched_qa_pairs():
+    """Test parsing QA pairs from a response covering several chunks."""
+    text = """```json
+    [
+      [{"question": "Q1?", "answer": "A1."}, {"question": "Q2?", "answer": "A2."}],
+      [{"question": "Q3?", "answer": "A3."}]
+    ]
+    ```"""
+    pairs = llm_processing.parse_batched_qa_pairs(text)
+    assert [pair["question"] for pair in pairs] == ["Q1?", "Q2?", "Q3?"]
+
+    # A flat array is accepted too
+    flat = '[{"question": "Q1?", "answer": "A1."}]'
+    assert llm_processing.parse_batched_qa_pairs(flat) == [{"question": "Q1?", "answer": "A1."}]
+
+    # Malformed JSON falls back to the lenient parser
+    broken = '[[{"question": "Q1?", "answer": "A1."},]'
+    assert llm_processing.parse_batched_qa_pairs(broken) == [{"question": "Q1?", "answer": "A1."}]
@@ -1,11 +1,13 @@
 """Unit tests for document parsers."""
 
+import asyncio
 import os
 import tempfile
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from synthetic_data_kit.parsers import multimodal_parser
 from synthetic_data_kit.parsers.html_parser import HTMLParser
 from synthetic_data_kit.parsers.pdf_parser import PDFParser
 from synthetic_data_kit.parsers.txt_parser import TXTParser
@@ -140,3 +142,37 @@ def test_pdf_parser():
                 saved_content = f.read()
 
             assert saved_content == "This is sample PDF content for testing."
+
+
+@pytest.mark.unit
+def test_multimodal_parser_aparse_matches_parse(tmp_path, monkeypatch):
+    """Test that parallel PDF page extraction returns the same pages in order."""
+    import fitz
+
+    pdf_path = str(tmp_path / "pages.pdf")
+    doc = fitz.open()
+    for i in range(6):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {i} text")
+    doc.save(pdf_path)
+    doc.close()
+
+    # Force the page ranges to be split across workers
+    monkeypatch.setattr(multimodal_parser, "MIN_PAGES_PER_WORKER", 2)
+    monkeypatch.setattr(multimodal_parser.os, "cpu_count", lambda: 3)
+
+    parser = multimodal_parser.MultimodalParser()
+    expected = parser.parse(pdf_path)
+    result = asyncio.run(parser.aparse(pdf_path))
+
+    assert result == expected
+    assert [page["text"].strip() for page in result] == [f"Page {i} text" for i in range(6)]
+
+
+@pytest.mark.unit
+def test_multimodal_page_pool_is_shared_and_spawned():
+    """Test that every aparse call shares one spawn-based worker pool."""
+    pool = multimodal_parser._get_page_pool()
+
+    assert multimodal_parser._get_page_pool() is pool
+    assert pool._mp_context.get_start_method() == "spawn"
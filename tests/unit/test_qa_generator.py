@@ -1,7 +1,8 @@
 """Unit tests for QA generator."""
 
+import asyncio
 import json
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -177,3 +178,92 @@ def test_process_document(patch_config):
     assert "qa_pairs" in result
     assert result["summary"] == "This is a summary of the document."
     assert len(result["qa_pairs"]) == 2
+
+
+@pytest.mark.unit
+def test_aprocess_documents(patch_config):
+    """Test processing documents with concurrent async LLM calls."""
+    mock_client = MagicMock()
+    mock_client.achat_completion = AsyncMock(
+        side_effect=[
+            "This is a summary of the document.",
+            json.dumps(
+                [
+                    {
+                        "question": "What is synthetic data?",
+                        "answer": "Synthetic data is artificially generated data.",
+                    },
+                    {
+                        "question": "Why use synthetic data?",
+                        "answer": "To protect privacy and create diverse training examples.",
+                    },
+                ]
+            ),
+        ]
+    )
+
+    generator = QAGenerator(client=mock_client)
+
+    result = asyncio.run(
+        generator.aprocess_documents(
+            documents=[{"text": "This is a document to process."}], num_pairs=2, verbose=False
+        )
+    )
+
+    assert result["summary"] == "This is a summary of the document."
+    assert len(result["qa_pairs"]) == 2
+    assert result["qa_pairs"][0]["question"] == "What is synthetic data?"
+    # One summary call plus one call for the single chunk
+    assert mock_client.achat_completion.await_count == 2
+    mock_client.batch_completion.assert_not_called()
+
+
+@pytest.mark.unit
+def test_agenerate_qa_pairs_packs_chunks(patch_config):
+    """Test that several chunks are packed into one request and the pairs fanned back out."""
+    responses = [
+        json.dumps(
+            [
+                [{"question": f"Q{i}?", "answer": f"A{i}."}],
+                [{"question": f"Q{i + 1}?", "answer": f"A{i + 1}."}],
+            ]
+        )
+        for i in (1, 3)
+    ]
+    mock_client = MagicMock()
+    mock_client.achat_completion = AsyncMock(side_effect=responses)
+
+    generator = QAGenerator(client=mock_client)
+    generator.generation_config.update(
+        {"chunk_size": 10, "overlap": 0, "chunks_per_request": 2}
+    )
+
+    document = "\n\n".join(f"Paragraph {i}." for i in range(4))
+    qa_pairs = asyncio.run(generator.agenerate_qa_pairs(document, "Summary.", num_pairs=4))
+
+    assert [pair["question"] for pair in qa_pairs] == ["Q1?", "Q2?", "Q3?", "Q4?"]
+    assert mock_client.achat_completion.await_count == 2
+    prompt = mock_client.achat_completion.await_args_list[0].args[0][0]["content"]
+    assert "<DOC1>" in prompt and "<DOC2>" in prompt and "<DOC3>" not in prompt
+
+
+@pytest.mark.unit
+def test_agenerate_qa_pairs_skips_failed_requests(patch_config):
+    """Test that a failed chunk request is skipped instead of aborting generation."""
+    mock_client = MagicMock()
+    mock_client.achat_completion = AsyncMock(
+        side_effect=[
+            Exception("Failed to get vLLM completion after 3 attempts"),
+            json.dumps([{"question": "Q2?", "answer": "A2."}]),
+        ]
+    )
+
+    generator = QAGenerator(client=mock_client)
+    generator.generation_config.update({"chunk_size": 10, "overlap": 0})
+
+    document = "\n\n".join(f"Paragraph {i}." for i in range(2))
+    qa_pairs = asyncio.run(generator.agenerate_qa_pairs(document, "Summary.", num_pairs=2))
+
+    assert qa_pairs == [{"question": "Q2?", "answer": "A2."}]
+    assert mock_client.achat_completion.await_count == 2
+    assert generator.failed_requests == 1
@@ -1,10 +1,12 @@
 """Unit tests for utility functions."""
 
+import asyncio
+import os
 from pathlib import Path
 
 import pytest
 
-from synthetic_data_kit.utils import config, text
+from synthetic_data_kit.utils import async_utils, config, lance_utils, text
 
 
 @pytest.mark.unit
@@ -159,3 +161,110 @@ def test_get_path_config():
     empty_config = {}
     default_path = config.get_path_config(empty_config, "output", "default")
     assert default_path == "data/output"
+
+
+@pytest.mark.unit
+def test_iter_lance_rows(tmpdir):
+    """Test streaming rows from a Lance dataset in batches."""
+    dataset_path = str(Path(tmpdir) / "sample.lance")
+    rows = [{"text": f"Row {i}"} for i in range(5)]
+    lance_utils.create_lance_dataset(rows, dataset_path)
+
+    streamed = lance_utils.iter_lance_rows(dataset_path, columns=["text", "image"], batch_size=2)
+
+    # Rows are produced lazily and in order; the missing image column is skipped
+    assert not isinstance(streamed, list)
+    assert list(streamed) == rows
+
+    with pytest.raises(FileNotFoundError):
+        list(lance_utils.iter_lance_rows(str(Path(tmpdir) / "missing.lance")))
+
+
+@pytest.mark.unit
+def test_iter_lance_rows_binary_zero_copy(tmpdir):
+    """Test that binary columns are streamed as memoryviews and unread columns are skipped."""
+    dataset_path = str(Path(tmpdir) / "images.lance")
+    rows = [{"text": "with image", "image": b"\x89PNG"}, {"text": "without image", "image": None}]
+    lance_utils.create_lance_dataset(rows, dataset_path)
+
+    streamed = list(lance_utils.iter_lance_rows(dataset_path, columns=["text", "image"], prefetch=0))
+
+    assert isinstance(streamed[0]["image"], memoryview)
+    assert bytes(streamed[0]["image"]) == b"\x89PNG"
+    assert streamed[1]["image"] is None
+
+    text_only = list(lance_utils.iter_lance_rows(dataset_path, columns=["text"]))
+    assert text_only == [{"text": "with image"}, {"text": "without image"}]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("binary_type", ["binary", "large_binary"])
+def test_binary_views_match_values(binary_type):
+    """Test that buffer-sliced views match the column values, including nulls and sliced arrays."""
+    import pyarrow as pa
+
+    column = pa.array([b"ab", None, b"", b"cde", b"f"], getattr(pa, binary_type)())
+    for array in (column, column.slice(1), column.slice(3)):
+        views = lance_utils._binary_views(array)
+        assert [None if view is None else bytes(view) for view in views] == array.to_pylist()
+
+
+@pytest.mark.unit
+def test_create_lance_dataset_streams_batches(tmpdir):
+    """Test writing a one-shot row iterator in batches with compressed binary columns."""
+    import lance
+    import pyarrow as pa
+
+    dataset_path = str(Path(tmpdir) / "batched.lance")
+    schema = pa.schema([pa.field("text", pa.string()), pa.field("image", pa.binary())])
+    rows = ({"text": f"Page {i}", "image": b"\x00" * 1024} for i in range(10))
+
+    lance_utils.create_lance_dataset(
+        rows, dataset_path, schema=schema, batch_size=3, max_rows_per_file=4
+    )
+
+    dataset = lance.dataset(dataset_path)
+    assert dataset.count_rows() == 10
+    assert len(dataset.get_fragments()) == 3
+    assert dataset.schema.field("image").metadata == {b"lance-encoding:compression": b"zstd"}
+    assert [row["text"] for row in lance_utils.iter_lance_rows(dataset_path)] == [
+        f"Page {i}" for i in range(10)
+    ]
+
+    # Empty input writes nothing
+    empty_path = str(Path(tmpdir) / "empty.lance")
+    lance_utils.create_lance_dataset(iter([]), empty_path, schema=schema)
+    assert not os.path.exists(empty_path)
+
+
+@pytest.mark.unit
+def test_prefetch_queue():
+    """Test that the prefetch queue preserves order and surfaces producer errors."""
+    assert list(lance_utils.PrefetchQueue(range(10), maxsize=2)) == list(range(10))
+
+    def failing():
+        yield 1
+        raise ValueError("decode failed")
+
+    prefetched = lance_utils.PrefetchQueue(failing(), maxsize=2)
+    assert next(prefetched) == 1
+    with pytest.raises(ValueError, match="decode failed"):
+        next(prefetched)
+    # The queue stays exhausted after the error
+    assert list(prefetched) == []
+
+
+@pytest.mark.unit
+def test_run_sync_with_and_without_running_loop():
+    """Test that run_sync works both from plain code and from inside an event loop."""
+    async def answer():
+        await asyncio.sleep(0)
+        return 42
+
+    assert async_utils.run_sync(answer()) == 42
+
+    async def caller():
+        # asyncio.run would raise here, as in a Jupyter cell
+        return async_utils.run_sync(answer())
+
+    assert asyncio.run(caller()) == 42